@@ -1,5 +1,6 @@
 import logging
 from typing import List
+from functools import lru_cache
 from binascii import hexlify, unhexlify
 
 from asn1crypto.keys import PublicKeyInfo
@@ -26,6 +27,13 @@ hachoir_log.use_print = False
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=2 ** 12)
+def _compress_public_key_info(public_key_info: bytes) -> bytes:
+    # DER encoded keys of older channels are checked again for every claim they signed
+    public_key = cPublicKey(PublicKeyInfo.load(public_key_info).native['public_key'])
+    return public_key.format(compressed=True)
+
+
 class Claim(Signable):
 
     STREAM = 'stream'
@@ -359,9 +367,7 @@ class Channel(BaseClaim):
     def public_key_bytes(self) -> bytes:
         if len(self.message.public_key) == 33:
             return self.message.public_key
-        public_key_info = PublicKeyInfo.load(self.message.public_key)
-        public_key = cPublicKey(public_key_info.native['public_key'])
-        return public_key.format(compressed=True)
+        return _compress_public_key_info(self.message.public_key)
 
     @public_key_bytes.setter
     def public_key_bytes(self, public_key: bytes):
@@ -1,6 +1,5 @@
 import base64
 from typing import List, TYPE_CHECKING, Union, Optional
-from binascii import hexlify
 from itertools import chain
 
 from lbry.error import ResolveCensoredError
@@ -89,7 +88,8 @@ class Outputs:
         }
 
     def message_to_txo(self, txo_message, tx_map):
-        if txo_message.WhichOneof('meta') == 'error':
+        meta_type = txo_message.WhichOneof('meta')
+        if meta_type == 'error':
             error = {
                 'error': {
                     'name': txo_message.error.Code.Name(txo_message.error.code),
@@ -106,7 +106,7 @@ class Outputs:
         if not tx:
             return
         txo = tx.outputs[txo_message.nout]
-        if txo_message.WhichOneof('meta') == 'claim':
+        if meta_type == 'claim':
             claim = txo_message.claim
             txo.meta = {
                 'short_url': f'lbry://{claim.short_url}',
@@ -147,7 +147,7 @@ class Outputs:
         for txo_message in chain(outputs.txos, outputs.extra_txos):
             if txo_message.WhichOneof('meta') == 'error':
                 continue
-            txs.add((hexlify(txo_message.tx_hash[::-1]).decode(), txo_message.height))
+            txs.add((txo_message.tx_hash[::-1].hex(), txo_message.height))
         return cls(
             outputs.txos, outputs.extra_txos, txs,
             outputs.offset, outputs.total,
@@ -160,7 +160,7 @@ class Outputs:
         for txo_message in chain(outputs.txos, outputs.extra_txos):
             if txo_message.WhichOneof('meta') == 'error':
                 continue
-            txs.add((hexlify(txo_message.tx_hash[::-1]).decode(), txo_message.height))
+            txs.add((txo_message.tx_hash[::-1].hex(), txo_message.height))
         return cls(
             outputs.txos, outputs.extra_txos, txs,
             outputs.offset, outputs.total,
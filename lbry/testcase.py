@@ -11,7 +11,6 @@ import unittest
 from unittest.case import _Outcome
 from typing import Optional
 from time import time
-from binascii import unhexlify
 from functools import partial
 
 from lbry.wallet import WalletManager, Wallet, Ledger, Account, Transaction
@@ -275,6 +274,11 @@ class IntegrationTestCase(AsyncioTestCase):
             lambda e: e.tx.id == txid
         )
 
+    def on_transaction_confirmed(self, txid, ledger=None):
+        return (ledger or self.ledger).on_transaction.where(
+            lambda e: e.tx.id == txid and e.tx.is_confirmed
+        )
+
     def on_address_update(self, address):
         return self.ledger.on_transaction.where(
             lambda e: e.address == address
@@ -357,8 +361,11 @@ class CommandTestCase(IntegrationTestCase):
         await self.account.ensure_address_gap()
         address = (await self.account.receiving.get_addresses(limit=1, only_usable=True))[0]
         sendtxid = await self.blockchain.send_to_address(address, 10)
-        await self.confirm_tx(sendtxid)
-        await self.generate(5)
+        await self.on_transaction_id(sendtxid)
+        # confirm the funding tx and mine the extra 5 blocks with a single generate call
+        confirmed = self.on_transaction_confirmed(sendtxid)
+        await self.generate(6)
+        await confirmed
 
         server_tmp_dir = tempfile.mkdtemp()
         self.addCleanup(shutil.rmtree, server_tmp_dir)
@@ -384,11 +391,11 @@ class CommandTestCase(IntegrationTestCase):
 
     async def asyncTearDown(self):
         await super().asyncTearDown()
-        for wallet_node in self.extra_wallet_nodes:
-            await wallet_node.stop(cleanup=True)
+        # nodes and daemons don't depend on each other, shut them down concurrently
+        await asyncio.gather(*(wallet_node.stop(cleanup=True) for wallet_node in self.extra_wallet_nodes))
         for daemon in self.daemons:
             daemon.component_manager.get_component('wallet')._running = False
-            await daemon.stop()
+        await asyncio.gather(*(daemon.stop() for daemon in self.daemons))
 
     async def add_daemon(self, wallet_node=None, seed=None):
         start_wallet_node = False
@@ -456,12 +463,14 @@ class CommandTestCase(IntegrationTestCase):
     async def confirm_tx(self, txid, ledger=None):
         """ Wait for tx to be in mempool, then generate a block, wait for tx to be in a block. """
         await self.on_transaction_id(txid, ledger)
+        # start waiting before generating, the confirmation can arrive while generate() waits on the header
+        confirmed = self.on_transaction_confirmed(txid, ledger)
         await self.generate(1)
-        await self.on_transaction_id(txid, ledger)
+        await confirmed
         return txid
 
     async def on_transaction_dict(self, tx):
-        await self.ledger.wait(Transaction(unhexlify(tx['hex'])))
+        await self.ledger.wait(Transaction.from_hex(tx['hex']))
 
     @staticmethod
     def get_all_addresses(tx):
@@ -474,6 +483,9 @@ class CommandTestCase(IntegrationTestCase):
 
     async def generate(self, blocks):
         """ Ask lbrycrd to generate some blocks and wait until ledger has them. """
+        if blocks <= 0:
+            # no header would arrive to end the wait below
+            return
         prepare = self.ledger.on_header.where(self.blockchain.is_expected_block)
         await self.blockchain.generate(blocks)
         await prepare  # no guarantee that it didn't happen already, so start waiting from before calling generate
@@ -570,9 +582,9 @@ class CommandTestCase(IntegrationTestCase):
             self.daemon.jsonrpc_publish(name, *args, **kwargs), confirm
         )
 
-    async def channel_create(self, name='@arena', bid='1.0', confirm=True, **kwargs):
+    async def channel_create(self, name='@arena', bid='1.0', confirm=True, return_tx=False, **kwargs):
         return await self.confirm_and_render(
-            self.daemon.jsonrpc_channel_create(name, bid, **kwargs), confirm
+            self.daemon.jsonrpc_channel_create(name, bid, **kwargs), confirm, return_tx
         )
 
     async def channel_update(self, claim_id, confirm=True, **kwargs):
@@ -71,6 +71,16 @@ def version_is_greater_than(version_a, version_b):
     return pkg_resources.parse_version(version_a) > pkg_resources.parse_version(version_b)
 
 
+def str_to_bool(value: str) -> bool:
+    """Same as the distutils strtobool (y/yes/t/true/on/1 and n/no/f/false/off/0) without importing distutils."""
+    value = value.lower()
+    if value in ('y', 'yes', 't', 'true', 'on', '1'):
+        return True
+    if value in ('n', 'no', 'f', 'false', 'off', '0'):
+        return False
+    raise ValueError(f"invalid truth value {value!r}")
+
+
 def rot13(some_str):
     return codecs.encode(some_str, 'rot_13')
 
@@ -454,6 +464,17 @@ def is_running_from_bundle():
     return getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS')
 
 
+class FastAsyncLock(asyncio.Lock):
+    """ asyncio.Lock which takes an uncontended lock inline instead of awaiting acquire() """
+
+    async def __aenter__(self):
+        if not self._locked and (not self._waiters or all(w.cancelled() for w in self._waiters)):
+            self._locked = True
+            return None
+        await self.acquire()
+        return None
+
+
 class LockWithMetrics(asyncio.Lock):
     def __init__(self, acquire_metric, held_time_metric, loop=None):
         super().__init__(loop=loop)
@@ -4,13 +4,13 @@ import json
 import logging
 import typing
 import asyncio
-import random
 from hashlib import sha256
 from string import hexdigits
-from typing import Type, Dict, Tuple, Optional, Any, List
+from typing import Type, Dict, Tuple, Optional, Any, List, AsyncIterator
 
 from lbry.error import InvalidPasswordError
 from lbry.crypto.crypt import aes_encrypt, aes_decrypt
+from lbry.utils import LRUCache, FastAsyncLock
 
 from .bip32 import PrivateKey, PublicKey, KeyPath, from_extended_key_string
 from .mnemonic import Mnemonic
@@ -24,21 +24,82 @@ if typing.TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+HEX_DIGITS = hexdigits.encode()
+# shared so the word -> index table is only built once
+MNEMONIC = Mnemonic()
+
+
 def validate_claim_id(claim_id):
     if not len(claim_id) == 40:
         raise Exception("Incorrect claimid length: %i" % len(claim_id))
-    if isinstance(claim_id, bytes):
-        claim_id = claim_id.decode('utf-8')
-    if set(claim_id).difference(hexdigits):
+    if isinstance(claim_id, str):
+        if not claim_id.isascii():
+            raise Exception("Claim id is not hex encoded")
+        claim_id = claim_id.encode()
+    # anything left after deleting the hex digits is not hex
+    if claim_id.translate(None, HEX_DIGITS):
         raise Exception("Claim id is not hex encoded")
 
 
+class ChannelKeys(dict):
+    """ Channel private key PEMs by address, invalidates the account hash when changed. """
+
+    __slots__ = ('account', '_sorted_keys_blob')
+
+    def __init__(self, account: 'Account', *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.account = account
+        self._sorted_keys_blob: Optional[bytes] = None
+
+    def _changed(self):
+        self._sorted_keys_blob = None
+        self.account._version += 1
+
+    @property
+    def sorted_keys_blob(self) -> bytes:
+        """ All addresses, sorted and concatenated, as fed into `Account.hash`. """
+        if self._sorted_keys_blob is None:
+            self._sorted_keys_blob = ''.join(sorted(self.keys())).encode()
+        return self._sorted_keys_blob
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        self._changed()
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self._changed()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._changed()
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+
 class DeterministicChannelKeyManager:
 
+    BATCH_SIZE = 32
+
     def __init__(self, account: 'Account'):
         self.account = account
         self.last_known = 0
         self.cache = {}
+        self.derived = LRUCache(self.BATCH_SIZE * 2)
         self.private_key: Optional[PrivateKey] = None
         if account.private_key is not None:
             self.private_key = account.private_key.child(KeyPath.CHANNEL)
@@ -46,7 +107,7 @@ class DeterministicChannelKeyManager:
     def maybe_generate_deterministic_key_for_channel(self, txo):
         if self.private_key is None:
             return
-        next_private_key = self.private_key.child(self.last_known)
+        next_private_key = self.get_child(self.last_known)
         public_key = next_private_key.public_key
         public_key_bytes = public_key.pubkey_bytes
         if txo.claim.channel.public_key_bytes == public_key_bytes:
@@ -57,15 +118,24 @@ class DeterministicChannelKeyManager:
         if self.private_key is not None:
             await self.generate_next_key()
 
+    def get_child(self, n: int) -> PrivateKey:
+        private_key = self.derived.get(n)
+        if private_key is None:
+            private_key = self.derived[n] = self.private_key.child(n)
+        return private_key
+
     async def generate_next_key(self) -> PrivateKey:
         db = self.account.ledger.db
         while True:
-            next_private_key = self.private_key.child(self.last_known)
-            public_key = next_private_key.public_key
-            self.cache[public_key.address] = next_private_key
-            if not await db.is_channel_key_used(self.account, public_key):
-                return next_private_key
-            self.last_known += 1
+            batch = [self.get_child(self.last_known + i) for i in range(self.BATCH_SIZE)]
+            public_keys = [private_key.public_key for private_key in batch]
+            for private_key, public_key in zip(batch, public_keys):
+                self.cache[public_key.address] = private_key
+            used = await db.are_channel_keys_used(self.account, public_keys)
+            for private_key, is_used in zip(batch, used):
+                if not is_used:
+                    return private_key
+                self.last_known += 1
 
     def get_private_key_from_pubkey_hash(self, pubkey_hash) -> PrivateKey:
         return self.cache.get(pubkey_hash)
@@ -81,7 +151,7 @@ class AddressManager:
         self.account = account
         self.public_key = public_key
         self.chain_number = chain_number
-        self.address_generator_lock = asyncio.Lock()
+        self.address_generator_lock = FastAsyncLock()
 
     @classmethod
     def from_dict(cls, account: 'Account', d: dict) \
@@ -116,6 +186,9 @@ class AddressManager:
     def get_private_key(self, index: int) -> PrivateKey:
         raise NotImplementedError
 
+    def clear_private_keys(self):
+        pass
+
     def get_public_key(self, index: int) -> PublicKey:
         raise NotImplementedError
 
@@ -128,15 +201,32 @@ class AddressManager:
     def get_address_records(self, only_usable: bool = False, **constraints):
         raise NotImplementedError
 
+    async def iter_address_records(self, cols=('address', 'used_times', 'n'),
+                                   chunk_size: int = 1000, **constraints) -> AsyncIterator[dict]:
+        """ Yield address records in `n` order, reading at most `chunk_size` rows at a time. """
+        assert 'n' in cols, "'n' column is required to page through addresses."
+        last_n = -1
+        while True:
+            records = await self._query_addresses(
+                cols=cols, n__gt=last_n, order_by="n asc", limit=chunk_size, **constraints
+            )
+            for record in records:
+                yield record
+            if len(records) < chunk_size:
+                return
+            last_n = records[-1]['n']
+
     async def get_addresses(self, only_usable: bool = False, **constraints) -> List[str]:
-        records = await self.get_address_records(only_usable=only_usable, **constraints)
+        # only select the address column, skips building a PublicKey for every row
+        records = await self.get_address_records(only_usable=only_usable, cols=('address',), **constraints)
         return [r['address'] for r in records]
 
     async def get_or_create_usable_address(self) -> str:
         async with self.address_generator_lock:
-            addresses = await self.get_addresses(only_usable=True, limit=10)
+            # let sqlite pick at random among the least used addresses and return just that one row
+            addresses = await self.get_addresses(only_usable=True, order_by="used_times asc, random()", limit=1)
         if addresses:
-            return random.choice(addresses)
+            return addresses[0]
         addresses = await self.ensure_address_gap()
         return addresses[0]
 
@@ -146,13 +236,34 @@ class HierarchicalDeterministic(AddressManager):
 
     name: str = "deterministic-chain"
 
-    __slots__ = 'gap', 'maximum_uses_per_address'
+    __slots__ = '_gap', '_maximum_uses_per_address', '_private_chain'
 
     def __init__(self, account: 'Account', chain: int, gap: int, maximum_uses_per_address: int) -> None:
         super().__init__(account, account.public_key.child(chain), chain)
+        self._private_chain: Optional[PrivateKey] = None
+        if account.private_key is not None:
+            self._private_chain = account.private_key.child(chain)
         self.gap = gap
         self.maximum_uses_per_address = maximum_uses_per_address
 
+    @property
+    def gap(self) -> int:
+        return self._gap
+
+    @gap.setter
+    def gap(self, gap: int):
+        self._gap = gap
+        self.account._version += 1
+
+    @property
+    def maximum_uses_per_address(self) -> int:
+        return self._maximum_uses_per_address
+
+    @maximum_uses_per_address.setter
+    def maximum_uses_per_address(self, maximum_uses_per_address: int):
+        self._maximum_uses_per_address = maximum_uses_per_address
+        self.account._version += 1
+
     @classmethod
     def from_dict(cls, account: 'Account', d: dict) -> Tuple[AddressManager, AddressManager]:
         return (
@@ -168,16 +279,21 @@ class HierarchicalDeterministic(AddressManager):
         return {'gap': self.gap, 'maximum_uses_per_address': self.maximum_uses_per_address}
 
     def get_private_key(self, index: int) -> PrivateKey:
-        return self.account.private_key.child(self.chain_number).child(index)
+        private_chain = self._private_chain
+        if private_chain is None or private_chain.parent is not self.account.private_key:
+            private_chain = self._private_chain = self.account.private_key.child(self.chain_number)
+        return private_chain.child(index)
+
+    def clear_private_keys(self):
+        self._private_chain = None
 
     def get_public_key(self, index: int) -> PublicKey:
-        return self.account.public_key.child(self.chain_number).child(index)
+        return self.public_key.child(index)
 
     async def get_max_gap(self) -> int:
-        addresses = await self._query_addresses(order_by="n asc")
         max_gap = 0
         current_gap = 0
-        for address in addresses:
+        async for address in self.iter_address_records(cols=('used_times', 'n')):
             if address['used_times'] == 0:
                 current_gap += 1
             else:
@@ -186,8 +302,10 @@ class HierarchicalDeterministic(AddressManager):
         return max_gap
 
     async def ensure_address_gap(self) -> List[str]:
+        # the lock only needs to cover picking the next indexes and saving the keys,
+        # announcing them to the network happens outside of it
         async with self.address_generator_lock:
-            addresses = await self._query_addresses(limit=self.gap, order_by="n desc")
+            addresses = await self._query_addresses(cols=('used_times', 'n'), limit=self.gap, order_by="n desc")
 
             existing_gap = 0
             for address in addresses:
@@ -199,16 +317,16 @@ class HierarchicalDeterministic(AddressManager):
             if existing_gap == self.gap:
                 return []
 
-            start = addresses[0]['pubkey'].n+1 if addresses else 0
+            start = addresses[0]['n']+1 if addresses else 0
             end = start + (self.gap - existing_gap)
             new_keys = await self._generate_keys(start, end-1)
-            await self.account.ledger.announce_addresses(self, new_keys)
-            return new_keys
+        await self.account.ledger.announce_addresses(self, new_keys)
+        return new_keys
 
     async def _generate_keys(self, start: int, end: int) -> List[str]:
         if not self.address_generator_lock.locked():
             raise RuntimeError('Should not be called outside of address_generator_lock.')
-        keys = [self.public_key.child(index) for index in range(start, end+1)]
+        keys = self.public_key.children(start, end)
         await self.account.ledger.db.add_keys(self.account, self.chain_number, keys)
         return [key.address for key in keys]
 
@@ -225,7 +343,12 @@ class SingleKey(AddressManager):
 
     name: str = "single-address"
 
-    __slots__ = ()
+    __slots__ = '_address_inserted',
+
+    def __init__(self, account, public_key, chain_number):
+        super().__init__(account, public_key, chain_number)
+        # the one address never changes, once it's in the db there's nothing left to check
+        self._address_inserted = False
 
     @classmethod
     def from_dict(cls, account: 'Account', d: dict) \
@@ -246,14 +369,18 @@ class SingleKey(AddressManager):
         return 0
 
     async def ensure_address_gap(self) -> List[str]:
+        if self._address_inserted:
+            return []
         async with self.address_generator_lock:
             exists = await self.get_address_records()
-            if not exists:
-                await self.account.ledger.db.add_keys(self.account, self.chain_number, [self.public_key])
-                new_keys = [self.public_key.address]
-                await self.account.ledger.announce_addresses(self, new_keys)
-                return new_keys
-            return []
+            if exists:
+                self._address_inserted = True
+                return []
+            await self.account.ledger.db.add_keys(self.account, self.chain_number, [self.public_key])
+            self._address_inserted = True
+        new_keys = [self.public_key.address]
+        await self.account.ledger.announce_addresses(self, new_keys)
+        return new_keys
 
     def get_address_records(self, only_usable: bool = False, **constraints):
         return self._query_addresses(**constraints)
@@ -261,6 +388,13 @@ class SingleKey(AddressManager):
 
 class Account:
 
+    __slots__ = (
+        '_version', '_hash_cache', 'ledger', 'wallet', 'id', '_name', 'seed', '_modified_on',
+        'private_key_string', 'init_vectors', 'encrypted', 'private_key', 'public_key',
+        'address_generator', 'receiving', 'change', 'address_managers', '_channel_keys',
+        'deterministic_channel_keys', 'channel_private_keys'
+    )
+
     address_generators: Dict[str, Type[AddressManager]] = {
         SingleKey.name: SingleKey,
         HierarchicalDeterministic.name: HierarchicalDeterministic,
@@ -270,6 +404,9 @@ class Account:
                  seed: str, private_key_string: str, encrypted: bool,
                  private_key: Optional[PrivateKey], public_key: PublicKey,
                  address_generator: dict, modified_on: float, channel_keys: dict) -> None:
+        # bumped on every change to the hashed state, see `hash`
+        self._version = 0
+        self._hash_cache: Optional[Tuple[int, bytes]] = None
         self.ledger = ledger
         self.wallet = wallet
         self.id = public_key.address
@@ -287,9 +424,38 @@ class Account:
         self.address_managers = {am.chain_number: am for am in (self.receiving, self.change)}
         self.channel_keys = channel_keys
         self.deterministic_channel_keys = DeterministicChannelKeyManager(self)
+        # parsed channel keys by PEM, keying on the PEM itself means entries never go stale
+        self.channel_private_keys: Dict[str, PrivateKey] = {}
         ledger.add_account(self)
         wallet.add_account(self)
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+        self._version += 1
+
+    @property
+    def modified_on(self) -> float:
+        return self._modified_on
+
+    @modified_on.setter
+    def modified_on(self, modified_on: float):
+        self._modified_on = modified_on
+        self._version += 1
+
+    @property
+    def channel_keys(self) -> ChannelKeys:
+        return self._channel_keys
+
+    @channel_keys.setter
+    def channel_keys(self, channel_keys: dict):
+        self._channel_keys = ChannelKeys(self, channel_keys)
+        self._version += 1
+
     def get_init_vector(self, key) -> Optional[bytes]:
         init_vector = self.init_vectors.get(key, None)
         if init_vector is None:
@@ -301,7 +467,7 @@ class Account:
                  name: str = None, address_generator: dict = None):
         return cls.from_dict(ledger, wallet, {
             'name': name,
-            'seed': Mnemonic().make_seed(),
+            'seed': MNEMONIC.make_seed(),
             'address_generator': address_generator or {}
         })
 
@@ -384,15 +550,22 @@ class Account:
                 if chain_name in d['address_generator']:
                     chain_object = getattr(self, chain_name)
                     chain_object.merge(d['address_generator'][chain_name])
-        self.channel_keys.update(d.get('certificates', {}))
+        # most syncs bring nothing new, only touch channel_keys (and invalidate `hash`) when they do
+        certificates = d.get('certificates', {})
+        channel_keys = self.channel_keys
+        if any(channel_keys.get(key_address) != pem for key_address, pem in certificates.items()):
+            channel_keys.update(certificates)
 
     @property
     def hash(self) -> bytes:
         assert not self.encrypted, "Cannot hash an encrypted account."
+        if self._hash_cache is not None and self._hash_cache[0] == self._version:
+            return self._hash_cache[1]
         h = sha256(json.dumps(self.to_dict(include_channel_keys=False)).encode())
-        for cert in sorted(self.channel_keys.keys()):
-            h.update(cert.encode())
-        return h.digest()
+        h.update(self.channel_keys.sorted_keys_blob)
+        digest = h.digest()
+        self._hash_cache = (self._version, digest)
+        return digest
 
     async def get_details(self, show_seed=False, **kwargs):
         satoshis = await self.get_balance(**kwargs)
@@ -425,6 +598,7 @@ class Account:
         self.private_key = private_key
         self.private_key_string = ""
         self.encrypted = False
+        self._version += 1
         return True
 
     def _decrypt_private_key_string(self, password: str) -> Optional[PrivateKey]:
@@ -444,7 +618,7 @@ class Account:
         if not seed:
             return ""
         try:
-            Mnemonic().mnemonic_decode(seed)
+            MNEMONIC.mnemonic_decode(seed)
         except IndexError:
             # failed to decode the seed, this either means it decrypted and is invalid
             # or that we hit an edge case where an incorrect password gave valid padding
@@ -455,12 +629,15 @@ class Account:
         assert not self.encrypted, "Key is already encrypted."
         if self.seed:
             self.seed = aes_encrypt(password, self.seed, self.get_init_vector('seed'))
-        if isinstance(self.private_key, PrivateKey):
+        if self.private_key is not None:
             self.private_key_string = aes_encrypt(
                 password, self.private_key.extended_key_string(), self.get_init_vector('private_key')
             )
             self.private_key = None
+            for address_manager in self.address_managers.values():
+                address_manager.clear_private_keys()
         self.encrypted = True
+        self._version += 1
         return True
 
     async def ensure_address_gap(self):
@@ -474,6 +651,11 @@ class Account:
         rows = await self.ledger.db.select_addresses('address', read_only=read_only, accounts=[self], **constraints)
         return [r['address'] for r in rows]
 
+    async def iter_addresses(self, **constraints) -> AsyncIterator[str]:
+        for address_manager in self.address_managers.values():
+            async for record in address_manager.iter_address_records(**constraints):
+                yield record['address']
+
     def get_address_records(self, **constraints):
         return self.ledger.db.get_addresses(accounts=[self], **constraints)
 
@@ -528,7 +710,7 @@ class Account:
             utxos = await self.get_utxos(**constraints)
             await self.ledger.reserve_outputs(utxos)
             tx = await Transaction.create(
-                inputs=[Input.spend(txo) for txo in utxos],
+                inputs=(Input.spend(txo) for txo in utxos),
                 outputs=[],
                 funding_accounts=[self],
                 change_account=to_account
@@ -538,10 +720,11 @@ class Account:
             to_hash160 = to_account.ledger.address_to_hash160(to_address)
             tx = await Transaction.create(
                 inputs=[],
-                outputs=[
+                # each output gets its own tx_ref/position, so they can't share one Output instance
+                outputs=(
                     Output.pay_pubkey_hash(amount//outputs, to_hash160)
                     for _ in range(outputs)
-                ],
+                ),
                 funding_accounts=[self],
                 change_account=self
             )
@@ -565,20 +748,37 @@ class Account:
         channel_pubkey_hash = self.ledger.public_key_to_address(public_key_bytes)
         private_key_pem = self.channel_keys.get(channel_pubkey_hash)
         if private_key_pem:
-            return PrivateKey.from_pem(self.ledger, private_key_pem)
+            return self._private_key_from_pem(private_key_pem)
         return self.deterministic_channel_keys.get_private_key_from_pubkey_hash(channel_pubkey_hash)
 
+    def _parse_private_key_pems(self, private_key_pems: List[str]) -> List[PrivateKey]:
+        return [PrivateKey.from_pem(self.ledger, private_key_pem) for private_key_pem in private_key_pems]
+
+    def _private_key_from_pem(self, private_key_pem: str) -> PrivateKey:
+        private_key = self.channel_private_keys.get(private_key_pem)
+        if private_key is None:
+            private_key = self.channel_private_keys[private_key_pem] = PrivateKey.from_pem(
+                self.ledger, private_key_pem
+            )
+        return private_key
+
     async def maybe_migrate_certificates(self):
         if not self.channel_keys:
             return
+        private_key_pems = [
+            private_key_pem for private_key_pem in self.channel_keys.values()
+            if isinstance(private_key_pem, str) and private_key_pem.startswith("-----BEGIN")
+        ]
+        unparsed = [pem for pem in private_key_pems if pem not in self.channel_private_keys]
+        if unparsed:
+            # PEM/ASN.1 parsing is slow for wallets with many channels, keep it off the event loop
+            private_keys = await asyncio.get_event_loop().run_in_executor(
+                None, self._parse_private_key_pems, unparsed
+            )
+            self.channel_private_keys.update(zip(unparsed, private_keys))
         channel_keys = {}
-        for private_key_pem in self.channel_keys.values():
-            if not isinstance(private_key_pem, str):
-                continue
-            if not private_key_pem.startswith("-----BEGIN"):
-                continue
-            private_key = PrivateKey.from_pem(self.ledger, private_key_pem)
-            channel_keys[private_key.address] = private_key_pem
+        for private_key_pem in private_key_pems:
+            channel_keys[self.channel_private_keys[private_key_pem].address] = private_key_pem
         if self.channel_keys != channel_keys:
             self.channel_keys = channel_keys
             self.wallet.save()
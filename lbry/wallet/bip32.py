@@ -1,3 +1,7 @@
+import hmac
+import hashlib
+from typing import List
+
 from asn1crypto.keys import PrivateKeyInfo, ECPrivateKey
 from coincurve import PublicKey as cPublicKey, PrivateKey as cPrivateKey
 from coincurve.utils import (
@@ -126,6 +130,23 @@ class PublicKey(_KeyBase):
         derived_key = self.verifying_key.add(L_b)
         return PublicKey(self.ledger, derived_key, R_b, n, self.depth + 1, self)
 
+    def children(self, start: int, end: int) -> List['PublicKey']:
+        """ Return the derived child extended pubkeys at indexes START through END (inclusive). """
+        if start < 0 or end >= (1 << 31):
+            raise ValueError('invalid BIP32 public key child number')
+
+        # the HMAC key schedule only depends on our chain code, so do it once for the whole batch
+        base_hmac = hmac.new(self.chain_code, digestmod=hashlib.sha512)
+        pubkey_bytes = self.pubkey_bytes
+        children = []
+        for n in range(start, end + 1):
+            child_hmac = base_hmac.copy()
+            child_hmac.update(pubkey_bytes + n.to_bytes(4, 'big'))
+            digest = child_hmac.digest()
+            derived_key = self.verifying_key.add(digest[:32])
+            children.append(PublicKey(self.ledger, derived_key, digest[32:], n, self.depth + 1, self))
+        return children
+
     def identifier(self):
         """ Return the key's identifier as 20 bytes. """
         return hash160(self.pubkey_bytes)
@@ -5,6 +5,7 @@ import sqlite3
 import platform
 from binascii import hexlify
 from collections import defaultdict
+from functools import lru_cache
 from dataclasses import dataclass
 from contextvars import ContextVar
 from typing import Tuple, List, Union, Callable, Any, Awaitable, Iterable, Dict, Optional
@@ -28,6 +29,10 @@ else:
 log = logging.getLogger(__name__)
 sqlite3.enable_callback_tracebacks(True)
 
+# sqlite3 caches compiled statements per connection keyed by SQL text, the default of 100
+# is smaller than the number of distinct wallet queries so hot statements were getting evicted
+CACHED_STATEMENTS = 512
+
 HISTOGRAM_BUCKETS = (
     .005, .01, .025, .05, .075, .1, .25, .5, .75, 1.0, 2.5, 5.0, 7.5, 10.0, 15.0, 20.0, 30.0, 60.0, float('inf')
 )
@@ -42,7 +47,7 @@ reader_context: Optional[ContextVar[ReaderProcessState]] = ContextVar('reader_co
 
 
 def initializer(path):
-    db = sqlite3.connect(path)
+    db = sqlite3.connect(path, cached_statements=CACHED_STATEMENTS)
     db.row_factory = dict_row_factory
     db.executescript("pragma journal_mode=WAL;")
     reader = ReaderProcessState(db.cursor())
@@ -106,6 +111,8 @@ class AIOSQLite:
         sqlite3.enable_callback_tracebacks(True)
         db = cls()
 
+        kwargs.setdefault('cached_statements', CACHED_STATEMENTS)
+
         def _connect_writer():
             db.writer_connection = sqlite3.connect(path, *args, **kwargs)
 
@@ -265,48 +272,65 @@ class AIOSQLite:
             self.writer_connection.execute('pragma foreign_keys=on').fetchone()
 
 
+@lru_cache(maxsize=1024)
+def _parse_constraint_key(key):
+    """ Split a constraint key into (kind, column, operator, value key, tag), keys repeat across queries. """
+    tag = '0'
+    if '#' in key:
+        key, tag = key[:key.index('#')], key[key.index('#')+1:]
+    col, op, key = key, '=', key.replace('.', '_')
+    if not key:
+        return 'sql', col, op, key, tag
+    if key.startswith('$$'):
+        col, key = col[2:], key[1:]
+    elif key.startswith('$'):
+        return 'value', col, op, key, tag
+    if key.endswith('__not'):
+        col, op = col[:-len('__not')], '!='
+    elif key.endswith('__is_null'):
+        return 'is_null', col[:-len('__is_null')], op, key, tag
+    if key.endswith('__is_not_null'):
+        return 'is_not_null', col[:-len('__is_not_null')], op, key, tag
+    if key.endswith('__lt'):
+        col, op = col[:-len('__lt')], '<'
+    elif key.endswith('__lte'):
+        col, op = col[:-len('__lte')], '<='
+    elif key.endswith('__gt'):
+        col, op = col[:-len('__gt')], '>'
+    elif key.endswith('__gte'):
+        col, op = col[:-len('__gte')], '>='
+    elif key.endswith('__like'):
+        col, op = col[:-len('__like')], 'LIKE'
+    elif key.endswith('__not_like'):
+        col, op = col[:-len('__not_like')], 'NOT LIKE'
+    elif key.endswith('__in'):
+        return 'in', col[:-len('__in')], ('IN', '='), key, tag
+    elif key.endswith('__not_in'):
+        return 'in', col[:-len('__not_in')], ('NOT IN', '!='), key, tag
+    elif key.endswith('__any') or key.endswith('__or'):
+        return 'or', col, op, key, tag
+    if key.endswith('__and'):
+        return 'and', col, op, key, tag
+    return 'op', col, op, key, tag
+
+
 def constraints_to_sql(constraints, joiner=' AND ', prepend_key=''):
     sql, values = [], {}
     for key, constraint in constraints.items():
-        tag = '0'
-        if '#' in key:
-            key, tag = key[:key.index('#')], key[key.index('#')+1:]
-        col, op, key = key, '=', key.replace('.', '_')
-        if not key:
+        kind, col, op, key, tag = _parse_constraint_key(key)
+        if kind == 'op':
+            sql.append(f'{col} {op} :{prepend_key}{key}{tag}')
+            values[prepend_key+key+tag] = constraint
+        elif kind == 'sql':
             sql.append(constraint)
-            continue
-        if key.startswith('$$'):
-            col, key = col[2:], key[1:]
-        elif key.startswith('$'):
+        elif kind == 'value':
             values[key] = constraint
-            continue
-        if key.endswith('__not'):
-            col, op = col[:-len('__not')], '!='
-        elif key.endswith('__is_null'):
-            col = col[:-len('__is_null')]
+        elif kind == 'is_null':
             sql.append(f'{col} IS NULL')
-            continue
-        if key.endswith('__is_not_null'):
-            col = col[:-len('__is_not_null')]
+        elif kind == 'is_not_null':
             sql.append(f'{col} IS NOT NULL')
-            continue
-        if key.endswith('__lt'):
-            col, op = col[:-len('__lt')], '<'
-        elif key.endswith('__lte'):
-            col, op = col[:-len('__lte')], '<='
-        elif key.endswith('__gt'):
-            col, op = col[:-len('__gt')], '>'
-        elif key.endswith('__gte'):
-            col, op = col[:-len('__gte')], '>='
-        elif key.endswith('__like'):
-            col, op = col[:-len('__like')], 'LIKE'
-        elif key.endswith('__not_like'):
-            col, op = col[:-len('__not_like')], 'NOT LIKE'
-        elif key.endswith('__in') or key.endswith('__not_in'):
-            if key.endswith('__in'):
-                col, op, one_val_op = col[:-len('__in')], 'IN', '='
-            else:
-                col, op, one_val_op = col[:-len('__not_in')], 'NOT IN', '!='
+        elif kind == 'in':
+            op, one_val_op = op
             if constraint:
                 if isinstance(constraint, (list, set, tuple)):
                     if len(constraint) == 1:
@@ -322,19 +346,10 @@ def constraints_to_sql(constraints, joiner=' AND ', prepend_key=''):
                     sql.append(f'{col} {op} ({constraint})')
                 else:
                     raise ValueError(f"{col} requires a list, set or string as constraint value.")
-            continue
-        elif key.endswith('__any') or key.endswith('__or'):
-            where, subvalues = constraints_to_sql(constraint, ' OR ', key+tag+'_')
-            sql.append(f'({where})')
-            values.update(subvalues)
-            continue
-        if key.endswith('__and'):
-            where, subvalues = constraints_to_sql(constraint, ' AND ', key+tag+'_')
+        else:
+            where, subvalues = constraints_to_sql(constraint, ' OR ' if kind == 'or' else ' AND ', key+tag+'_')
             sql.append(f'({where})')
             values.update(subvalues)
-            continue
-        sql.append(f'{col} {op} :{prepend_key}{key}{tag}')
-        values[prepend_key+key+tag] = constraint
     return joiner.join(sql) if sql else '', values
 
 
@@ -1245,16 +1260,19 @@ class Database(SQLiteMixin):
         await self._set_address_history(address, history)
 
     async def is_channel_key_used(self, account, key: PublicKey):
+        return (await self.are_channel_keys_used(account, [key]))[0]
+
+    async def are_channel_keys_used(self, account, keys: List[PublicKey]) -> List[bool]:
         channels = await self.get_txos(
             accounts=[account], txo_type=TXO_TYPES['channel'],
             no_tx=True, no_channel_info=True
         )
-        other_key_bytes = key.pubkey_bytes
+        used_key_bytes = set()
         for channel in channels:
             claim = channel.can_decode_claim
-            if claim and claim.channel.public_key_bytes == other_key_bytes:
-                return True
-        return False
+            if claim:
+                used_key_bytes.add(claim.channel.public_key_bytes)
+        return [key.pubkey_bytes in used_key_bytes for key in keys]
 
     @staticmethod
     def constrain_purchases(constraints):
@@ -625,12 +625,21 @@ class Ledger(metaclass=LedgerRegistry):
                 for account in self.accounts:
                     account.deterministic_channel_keys.maybe_generate_deterministic_key_for_channel(txo)
 
+    def get_cached_transaction(self, txid: str) -> Optional[Transaction]:
+        cached_tx = self._tx_cache.get(txid)
+        if cached_tx is not None and cached_tx.tx is not None and cached_tx.tx.is_verified:
+            return cached_tx.tx
+
+    def cache_transaction(self, tx: Transaction):
+        if tx.is_verified and tx.id not in self._tx_cache:
+            self._tx_cache[tx.id] = TransactionCacheItem(tx)
+
     async def request_transactions(self, to_request: Tuple[Tuple[str, int], ...], cached=False):
         batches = [[]]
         remote_heights = {}
         cache_hits = set()
 
-        for txid, height in sorted(to_request, key=lambda x: x[1]):
+        for txid, height in sorted(to_request, key=itemgetter(1)):
             if cached:
                 cached_tx = self._tx_cache.get(txid)
                 if cached_tx is not None:
@@ -720,7 +729,7 @@ class Ledger(metaclass=LedgerRegistry):
 
     def broadcast(self, tx):
         # broadcast can't be a retriable call yet
-        return self.network.broadcast(hexlify(tx.raw).decode())
+        return self.network.broadcast(tx.raw.hex())
 
     async def wait(self, tx: Transaction, height=-1, timeout=1):
         timeout = timeout or 600  # after 10 minutes there is almost 0 hope
@@ -1116,16 +1125,17 @@ class Ledger(metaclass=LedgerRegistry):
                     'nout': txo.position,
                     'is_spent': txo.is_spent,
                 })
+            spent_claims = None
             for txo in tx.my_update_outputs:
                 if is_my_inputs:  # updating my own claim
-                    previous = None
-                    for txi in tx.inputs:
-                        if txi.txo_ref.txo is not None:
+                    if spent_claims is None:
+                        # index the spent claims once instead of scanning the inputs per update
+                        spent_claims = {}
+                        for txi in tx.inputs:
                             other_txo = txi.txo_ref.txo
-                            if (other_txo.is_claim or other_txo.script.is_support_claim) \
-                                and other_txo.claim_id == txo.claim_id:
-                                previous = other_txo
-                                break
+                            if other_txo is not None and (other_txo.is_claim or other_txo.script.is_support_claim):
+                                spent_claims.setdefault(other_txo.claim_hash, other_txo)
+                    previous = spent_claims.get(txo.claim_hash)
                     if previous is not None:
                         item['update_info'].append({
                             'address': txo.get_address(self),
@@ -3,7 +3,6 @@ import json
 import typing
 import logging
 import asyncio
-from distutils.util import strtobool
 
 from binascii import unhexlify
 from decimal import Decimal
@@ -11,6 +10,7 @@ from typing import List, Type, MutableSequence, MutableMapping, Optional
 
 from lbry.error import KeyFeeAboveMaxAllowedError, WalletNotLoadedError
 from lbry.conf import Config, NOT_SET
+from lbry.utils import str_to_bool
 
 from .dewies import dewies_to_lbc
 from .account import Account
@@ -183,7 +183,7 @@ class WalletManager:
         }[config.blockchain_name]
 
         ledger_config = {
-            'use_go_hub': not strtobool(os.environ.get('ENABLE_LEGACY_SEARCH') or 'yes'),
+            'use_go_hub': not str_to_bool(os.environ.get('ENABLE_LEGACY_SEARCH') or 'yes'),
             'auto_connect': True,
             'explicit_servers': [],
             'hub_timeout': config.hub_timeout,
@@ -238,7 +238,7 @@ class WalletManager:
 
     async def reset(self):
         self.ledger.config = {
-            'use_go_hub': not strtobool(os.environ.get('ENABLE_LEGACY_SEARCH') or 'yes'),
+            'use_go_hub': not str_to_bool(os.environ.get('ENABLE_LEGACY_SEARCH') or 'yes'),
             'auto_connect': True,
             'explicit_servers': [],
             'default_servers': Config.lbryum_servers.default,
@@ -281,6 +281,9 @@ class WalletManager:
 
     async def get_transaction(self, txid: str):
         tx = await self.db.get_transaction(txid=txid)
+        if tx:
+            return tx
+        tx = self.ledger.get_cached_transaction(txid)
         if tx:
             return tx
         try:
@@ -290,9 +293,10 @@ class WalletManager:
                 return {'success': False, 'code': 404, 'message': 'transaction not found'}
             return {'success': False, 'code': e.code, 'message': e.message}
         height = merkle.get('block_height')
-        tx = Transaction(unhexlify(raw), height=height)
+        tx = Transaction.from_hex(raw, height=height)
         if height and height > 0:
             await self.ledger.maybe_verify_transaction(tx, height, merkle)
+            self.ledger.cache_transaction(tx)
         return tx
 
     async def create_purchase_transaction(
@@ -103,6 +103,7 @@ class Mnemonic:
     def __init__(self, lang='en'):
         language_name = LANGUAGE_NAMES.get(lang, 'english')
         self.words = load_words(language_name)
+        self.word_indexes = {word: k for k, word in enumerate(self.words)}
 
     @staticmethod
     def mnemonic_to_seed(mnemonic, passphrase=''):
@@ -128,7 +129,9 @@ class Mnemonic:
         i = 0
         while words:
             word = words.pop()
-            k = self.words.index(word)
+            k = self.word_indexes.get(word)
+            if k is None:
+                raise ValueError(f"{word!r} is not in list")
             i = i*n + k
         return i
 
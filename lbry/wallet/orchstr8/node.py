@@ -8,18 +8,19 @@ import logging
 import tempfile
 import subprocess
 import importlib
-from distutils.util import strtobool
 
-from binascii import hexlify
-from typing import Type, Optional
+from typing import Type, Optional, List, Tuple
 import urllib.request
 from uuid import uuid4
 
+import aiohttp
+
 import lbry
 from lbry.wallet.server.server import Server
 from lbry.wallet.server.env import Env
 from lbry.wallet import Wallet, Ledger, RegTestLedger, WalletManager, Account, BlockHeightEvent
 from lbry.conf import KnownHubsList, Config
+from lbry.utils import str_to_bool
 from lbry.wallet.orchstr8 import __hub_url__
 
 log = logging.getLogger(__name__)
@@ -146,7 +147,7 @@ class WalletNode:
         self.manager = self.manager_class.from_config({
             'ledgers': {
                 self.ledger_class.get_id(): {
-                    'use_go_hub': not strtobool(os.environ.get('ENABLE_LEGACY_SEARCH') or 'yes'),
+                    'use_go_hub': not str_to_bool(os.environ.get('ENABLE_LEGACY_SEARCH') or 'yes'),
                     'api_port': self.port,
                     'explicit_servers': [(spv_node.hostname, spv_node.port)],
                     'default_servers': Config.lbryum_servers.default,
@@ -415,6 +416,26 @@ class BlockchainNode:
             raise Exception(result)
         return result
 
+    async def batch_rpc(self, calls: List[Tuple[str, list]]) -> list:
+        """ Send several RPC calls to lbrycrd in one JSON-RPC batch request, results are in call order. """
+        payload = [
+            {'jsonrpc': '1.0', 'id': i, 'method': method, 'params': params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        self.log.debug('batch rpc: %s', ' '.join(method for method, _ in calls))
+        async with aiohttp.ClientSession() as session:
+            async with session.post(self.rpc_url, json=payload) as response:
+                response.raise_for_status()
+                results = await response.json()
+        if not isinstance(results, list):
+            error = (results or {}).get('error') or {}
+            raise Exception(f"error code: {error.get('code')}, {error.get('message', results)}")
+        results.sort(key=lambda r: r['id'])
+        for result in results:
+            if result['error'] is not None:
+                raise Exception(f"error code: {result['error']['code']}, {result['error']['message']}")
+        return [result['result'] for result in results]
+
     def generate(self, blocks):
         self.block_expected += blocks
         return self._cli_cmnd('generate', str(blocks))
@@ -453,7 +474,7 @@ class BlockchainNode:
         return json.loads(await self._cli_cmnd('signrawtransactionwithwallet', tx))['hex'].encode()
 
     def decode_raw_transaction(self, tx):
-        return self._cli_cmnd('decoderawtransaction', hexlify(tx.raw).decode())
+        return self._cli_cmnd('decoderawtransaction', tx.raw.hex())
 
     def get_raw_transaction(self, txid):
         return self._cli_cmnd('getrawtransaction', txid, '1')
@@ -1,3 +1,4 @@
+import os
 import time
 import asyncio
 import typing
@@ -188,6 +189,9 @@ class BlockProcessor:
     Coordinate backing up in case of chain reorganisations.
     """
 
+    # minimum number of signatures in a block before they're verified on the signature executor
+    parallel_signature_threshold = 64
+
     block_count_metric = Gauge(
         "block_count", "Number of processed blocks", namespace=NAMESPACE
     )
@@ -205,6 +209,10 @@ class BlockProcessor:
         self.daemon = daemon
         self._chain_executor = ThreadPoolExecutor(1, thread_name_prefix='block-processor')
         self._sync_reader_executor = ThreadPoolExecutor(1, thread_name_prefix='hub-es-sync')
+        self._signature_workers = os.cpu_count() or 1
+        self._signature_executor = None if self._signature_workers < 2 else ThreadPoolExecutor(
+            self._signature_workers, thread_name_prefix='signature-verifier'
+        )
         self.mempool = MemPool(env.coin, daemon, db, self.state_lock)
         self.shutdown_event = shutdown_event
         self.coin = env.coin
@@ -275,6 +283,7 @@ class BlockProcessor:
 
         self.removed_claims_to_send_es = set()  # cumulative changes across blocks to send ES
         self.touched_claims_to_send_es = set()
+        self.es_filters_stale = True  # re-indexed claims may need blocking and filtering applied again
         self.activation_info_to_send_es: DefaultDict[str, List[TrendingNotification]] = defaultdict(list)
 
         self.removed_claim_hashes: Set[bytes] = set()  # per block changes
@@ -292,6 +301,8 @@ class BlockProcessor:
 
         self.doesnt_have_valid_signature: Set[bytes] = set()
         self.claim_channels: Dict[bytes, bytes] = {}
+        # (tx hash, nout) to signature validity, for claims signed by channels already in the db
+        self.prevalidated_signatures: Dict[Tuple[bytes, int], bool] = {}
         self.hashXs_by_tx: DefaultDict[bytes, List[int]] = defaultdict(list)
 
         self.pending_transaction_num_mapping: Dict[bytes, int] = {}
@@ -361,10 +372,15 @@ class BlockProcessor:
                         self.activation_info_to_send_es.clear()
                 # TODO: we shouldnt wait on the search index updating before advancing to the next block
                 if not self.db.first_sync:
-                    await self.db.reload_blocking_filtering_streams()
-                    await self.db.search_index.claim_consumer(self.claim_producer())
-                    await self.db.search_index.apply_filters(self.db.blocked_streams, self.db.blocked_channels,
-                                                                 self.db.filtered_streams, self.db.filtered_channels)
+                    # blocks that touched no claims (such as runs of empty blocks) leave the index as it was
+                    if self.touched_claims_to_send_es or self.removed_claims_to_send_es or self.es_filters_stale:
+                        await self.db.reload_blocking_filtering_streams()
+                        await self.db.search_index.claim_consumer(self.claim_producer())
+                        await self.db.search_index.apply_filters(
+                            self.db.blocked_streams, self.db.blocked_channels,
+                            self.db.filtered_streams, self.db.filtered_channels
+                        )
+                        self.es_filters_stale = False
                     await self.db.search_index.update_trending_score(self.activation_info_to_send_es)
                     await self._es_caught_up()
                 self.db.search_index.clear_caches()
@@ -411,6 +427,7 @@ class BlockProcessor:
                             self.removed_claims_to_send_es.add(touched)
                     self.touched_claims_to_send_es.difference_update(self.removed_claims_to_send_es)
                     await self.db.search_index.claim_consumer(self.claim_producer())
+                    self.es_filters_stale = True
                     self.db.search_index.clear_caches()
                     self.touched_claims_to_send_es.clear()
                     self.removed_claims_to_send_es.clear()
@@ -485,36 +502,10 @@ class BlockProcessor:
             self.pending_channels[claim_hash] = txo.claim.channel.public_key_bytes
 
         self.doesnt_have_valid_signature.add(claim_hash)
-        raw_channel_tx = None
         if signable and signable.signing_channel_hash:
-            signing_channel = self.db.get_claim_txo(signing_channel_hash)
-
-            if signing_channel:
-                raw_channel_tx = self.db.prefix_db.tx.get(
-                    self.db.get_tx_hash(signing_channel.tx_num), deserialize_value=False
-                )
-            channel_pub_key_bytes = None
-            try:
-                if not signing_channel:
-                    if txo.signable.signing_channel_hash[::-1] in self.pending_channels:
-                        channel_pub_key_bytes = self.pending_channels[signing_channel_hash]
-                elif raw_channel_tx:
-                    chan_output = self.coin.transaction(raw_channel_tx).outputs[signing_channel.position]
-                    chan_script = OutputScript(chan_output.pk_script)
-                    chan_script.parse()
-                    channel_meta = Claim.from_bytes(chan_script.values['claim'])
-
-                    channel_pub_key_bytes = channel_meta.channel.public_key_bytes
-                if channel_pub_key_bytes:
-                    channel_signature_is_valid = Output.is_signature_valid(
-                        txo.signable.signature, txo.get_signature_digest(self.ledger), channel_pub_key_bytes
-                    )
-                    if channel_signature_is_valid:
-                        self.pending_channel_counts[signing_channel_hash] += 1
-                        self.doesnt_have_valid_signature.remove(claim_hash)
-                        self.claim_channels[claim_hash] = signing_channel_hash
-            except:
-                self.logger.exception(f"error validating channel signature for %s:%i", tx_hash[::-1].hex(), nout)
+            channel_signature_is_valid = self._validate_channel_signature(
+                txo, tx_hash, nout, claim_hash, signing_channel_hash
+            )
 
         if txo.script.is_claim_name:  # it's a root claim
             root_tx_num, root_idx = tx_num, nout
@@ -560,6 +551,102 @@ class BlockProcessor:
         self.claim_hash_to_txo[claim_hash] = (tx_num, nout)
         self.get_add_claim_utxo_ops(pending)
 
+    def _validate_channel_signature(self, txo: 'Output', tx_hash: bytes, nout: int, claim_hash: bytes,
+                                    signing_channel_hash: bytes) -> bool:
+        channel_signature_is_valid = False
+        prevalidated = self.prevalidated_signatures.pop((tx_hash, nout), None)
+        try:
+            if prevalidated is not None:
+                channel_signature_is_valid = prevalidated
+            else:
+                channel_pub_key_bytes = self._get_db_channel_public_key(signing_channel_hash)
+                if channel_pub_key_bytes is None:
+                    channel_pub_key_bytes = self.pending_channels.get(signing_channel_hash)
+                if channel_pub_key_bytes:
+                    channel_signature_is_valid = Output.is_signature_valid(
+                        txo.signable.signature, txo.get_signature_digest(self.ledger), channel_pub_key_bytes
+                    )
+            if channel_signature_is_valid:
+                self.pending_channel_counts[signing_channel_hash] += 1
+                self.doesnt_have_valid_signature.remove(claim_hash)
+                self.claim_channels[claim_hash] = signing_channel_hash
+        except:
+            self.logger.exception(f"error validating channel signature for %s:%i", tx_hash[::-1].hex(), nout)
+        return channel_signature_is_valid
+
+    def _get_db_channel_public_key(self, signing_channel_hash: bytes) -> Optional[bytes]:
+        """
+        Returns b'' for a channel that is in the db but whose public key can't be read, and None for a channel
+        that isn't in the db.
+        """
+        signing_channel = self.db.get_claim_txo(signing_channel_hash)
+        if not signing_channel:
+            return None
+        raw_channel_tx = self.db.prefix_db.tx.get(
+            self.db.get_tx_hash(signing_channel.tx_num), deserialize_value=False
+        )
+        if not raw_channel_tx:
+            return b''
+        return self._get_channel_public_key(raw_channel_tx, signing_channel.position) or b''
+
+    def _get_channel_public_key(self, raw_channel_tx: bytes, position: int) -> bytes:
+        chan_output = self.coin.transaction(raw_channel_tx).outputs[position]
+        chan_script = OutputScript(chan_output.pk_script)
+        chan_script.parse()
+        channel_meta = Claim.from_bytes(chan_script.values['claim'])
+        return channel_meta.channel.public_key_bytes
+
+    @staticmethod
+    def _verify_signatures(checks: List[Tuple[bytes, bytes, bytes]]) -> List[Optional[bool]]:
+        results = []
+        for signature, digest, public_key_bytes in checks:
+            try:
+                results.append(Output.is_signature_valid(signature, digest, public_key_bytes))
+            except Exception:
+                results.append(None)  # left for _add_claim_or_update to retry and log
+        return results
+
+    def _prevalidate_signatures(self, txs: List[Tuple[Tx, bytes]], block_txos: List[List[Output]]):
+        """
+        Verify the signatures of claims signed by channels that are already in the db across the signature
+        executor before the block is advanced. The db isn't written to until the block is flushed, so these
+        channels resolve to the same public key _add_claim_or_update would use. Claims signed by channels from
+        the same block are still verified serially.
+        """
+        if not self._signature_executor:
+            return
+        signed = []
+        for (_, tx_hash), txos in zip(txs, block_txos):
+            for nout, txo in enumerate(txos):
+                if not (txo.script.is_claim_name or txo.script.is_update_claim):
+                    continue
+                try:
+                    if txo.claim.is_signed:
+                        signed.append((tx_hash, nout, txo))
+                except Exception:
+                    continue
+        if len(signed) < self.parallel_signature_threshold:
+            return
+        keys, checks = [], []
+        for tx_hash, nout, txo in signed:
+            try:
+                channel_pub_key_bytes = self._get_db_channel_public_key(txo.signable.signing_channel_hash[::-1])
+                if not channel_pub_key_bytes:
+                    continue
+                checks.append((txo.signable.signature, txo.get_signature_digest(self.ledger), channel_pub_key_bytes))
+            except Exception:
+                continue
+            keys.append((tx_hash, nout))
+        if not checks:
+            return
+        chunk_size = -(-len(checks) // self._signature_workers)
+        results = []
+        for chunk_results in self._signature_executor.map(self._verify_signatures, chunks(checks, chunk_size)):
+            results.extend(chunk_results)
+        for key, is_valid in zip(keys, results):
+            if is_valid is not None:
+                self.prevalidated_signatures[key] = is_valid
+
     def get_add_claim_utxo_ops(self, pending: StagedClaimtrieItem):
         # claim tip by claim hash
         self.db.prefix_db.claim_to_txo.stage_put(
@@ -578,9 +665,10 @@ class BlockProcessor:
         )
 
         # short url resolution
+        claim_id = pending.claim_hash.hex()
         for prefix_len in range(10):
             self.db.prefix_db.claim_short_id.stage_put(
-                (pending.normalized_name, pending.claim_hash.hex()[:prefix_len + 1],
+                (pending.normalized_name, claim_id[:prefix_len + 1],
                  pending.root_tx_num, pending.root_position),
                 (pending.tx_num, pending.position)
             )
@@ -620,9 +708,10 @@ class BlockProcessor:
         )
 
         # short url resolution
+        claim_id = pending.claim_hash.hex()
         for prefix_len in range(10):
             self.db.prefix_db.claim_short_id.stage_delete(
-                (pending.normalized_name, pending.claim_hash.hex()[:prefix_len + 1],
+                (pending.normalized_name, claim_id[:prefix_len + 1],
                  pending.root_tx_num, pending.root_position),
                 (pending.tx_num, pending.position)
             )
@@ -1445,14 +1534,15 @@ class BlockProcessor:
         spend_claim_or_support_txo = self._spend_claim_or_support_txo
         add_claim_or_support = self._add_claim_or_support
         txs: List[Tuple[Tx, bytes]] = block.transactions
+        block_txos = [Transaction(tx.raw).outputs for tx, _ in txs]
+        self._prevalidate_signatures(txs, block_txos)
 
         self.db.prefix_db.block_hash.stage_put(key_args=(height,), value_args=(self.coin.header_hash(block.header),))
         self.db.prefix_db.header.stage_put(key_args=(height,), value_args=(block.header,))
         self.db.prefix_db.block_txs.stage_put(key_args=(height,), value_args=([tx_hash for tx, tx_hash in txs],))
 
-        for tx, tx_hash in txs:
+        for (tx, tx_hash), txos in zip(txs, block_txos):
             spent_claims = {}
-            txos = Transaction(tx.raw).outputs
 
             self.db.prefix_db.tx.stage_put(key_args=(tx_hash,), value_args=(tx.raw,))
             self.db.prefix_db.tx_num.stage_put(key_args=(tx_hash,), value_args=(tx_count,))
@@ -1579,6 +1669,7 @@ class BlockProcessor:
         self.expired_claim_hashes.clear()
         self.doesnt_have_valid_signature.clear()
         self.claim_channels.clear()
+        self.prevalidated_signatures.clear()
         self.utxo_cache.clear()
         self.hashXs_by_tx.clear()
         self.history_cache.clear()
@@ -1769,6 +1860,7 @@ class BlockProcessor:
             self.status_server.set_height(self.db.fs_height, self.db.db_tip)
             await self.db.initialize_caches()
             await self.db.search_index.start()
+            await self.db.search_index.create_index()
             await asyncio.wait([
                 self.prefetcher.main_loop(self.height),
                 self._process_prefetched_blocks()
@@ -1784,4 +1876,6 @@ class BlockProcessor:
             self.logger.info('closing the DB for a clean shutdown...')
             self._sync_reader_executor.shutdown(wait=True)
             self._chain_executor.shutdown(wait=True)
+            if self._signature_executor:
+                self._signature_executor.shutdown(wait=True)
             self.db.close()
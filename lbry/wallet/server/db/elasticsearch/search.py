@@ -21,6 +21,124 @@ from lbry.wallet.server.util import class_logger
 from lbry.wallet.server.db.common import ResolveResult
 
 
+TRENDING_SCORE_SCRIPT = """
+    double softenLBC(double lbc) { return (Math.pow(lbc, 1.0 / 3.0)); }
+
+    double logsumexp(double x, double y)
+    {
+        double top;
+        if(x > y)
+            top = x;
+        else
+            top = y;
+        double result = top + Math.log(Math.exp(x-top) + Math.exp(y-top));
+        return(result);
+    }
+
+    double logdiffexp(double big, double small)
+    {
+        return big + Math.log(1.0 - Math.exp(small - big));
+    }
+
+    double squash(double x)
+    {
+        if(x < 0.0)
+            return -Math.log(1.0 - x);
+        else
+            return Math.log(x + 1.0);
+    }
+
+    double unsquash(double x)
+    {
+        if(x < 0.0)
+            return 1.0 - Math.exp(-x);
+        else
+            return Math.exp(x) - 1.0;
+    }
+
+    double log_to_squash(double x)
+    {
+        return logsumexp(x, 0.0);
+    }
+
+    double squash_to_log(double x)
+    {
+        //assert x > 0.0;
+        return logdiffexp(x, 0.0);
+    }
+
+    double squashed_add(double x, double y)
+    {
+        // squash(unsquash(x) + unsquash(y)) but avoiding overflow.
+        // Cases where the signs are the same
+        if (x < 0.0 && y < 0.0)
+            return -logsumexp(-x, logdiffexp(-y, 0.0));
+        if (x >= 0.0 && y >= 0.0)
+            return logsumexp(x, logdiffexp(y, 0.0));
+        // Where the signs differ
+        if (x >= 0.0 && y < 0.0)
+            if (Math.abs(x) >= Math.abs(y))
+                return logsumexp(0.0, logdiffexp(x, -y));
+            else
+                return -logsumexp(0.0, logdiffexp(-y, x));
+        if (x < 0.0 && y >= 0.0)
+        {
+            // Addition is commutative, hooray for new math
+            return squashed_add(y, x);
+        }
+        return 0.0;
+    }
+
+    double squashed_multiply(double x, double y)
+    {
+        // squash(unsquash(x)*unsquash(y)) but avoiding overflow.
+        int sign;
+        if(x*y >= 0.0)
+            sign = 1;
+        else
+            sign = -1;
+        return sign*logsumexp(squash_to_log(Math.abs(x))
+                        + squash_to_log(Math.abs(y)), 0.0);
+    }
+
+    // Squashed inflated units
+    double inflateUnits(int height) {
+        double timescale = 576.0; // Half life of 400 = e-folding time of a day
+                                  // by coincidence, so may as well go with it
+        return log_to_squash(height / timescale);
+    }
+
+    double spikePower(double newAmount) {
+        if (newAmount < 50.0) {
+            return(0.5);
+        } else if (newAmount < 85.0) {
+            return(newAmount / 100.0);
+        } else {
+            return(0.85);
+        }
+    }
+
+    double spikeMass(double oldAmount, double newAmount) {
+        double softenedChange = softenLBC(Math.abs(newAmount - oldAmount));
+        double changeInSoftened = Math.abs(softenLBC(newAmount) - softenLBC(oldAmount));
+        double power = spikePower(newAmount);
+        if (oldAmount > newAmount) {
+            -1.0 * Math.pow(changeInSoftened, power) * Math.pow(softenedChange, 1.0 - power)
+        } else {
+            Math.pow(changeInSoftened, power) * Math.pow(softenedChange, 1.0 - power)
+        }
+    }
+    for (i in params.src.changes) {
+        double units = inflateUnits(i.height);
+        if (ctx._source.trending_score == null) {
+            ctx._source.trending_score = 0.0;
+        }
+        double bigSpike = squashed_multiply(units, squash(spikeMass(i.prev_amount, i.new_amount)));
+        ctx._source.trending_score = squashed_add(ctx._source.trending_score, bigSpike);
+    }
+"""
+
+
 class ChannelResolution(str):
     @classmethod
     def lookup_error(cls, url):
@@ -53,6 +171,7 @@ class SearchIndex:
         self.search_cache = LRUCache(2 ** 17)
         self._elastic_host = elastic_host
         self._elastic_port = elastic_port
+        self.trending_script_id = index_prefix + 'update_trending_score'
 
     async def get_index_version(self) -> int:
         try:
@@ -66,9 +185,9 @@ class SearchIndex:
             self.index, body={'version': version, 'index_patterns': ['ignored']}, ignore=400
         )
 
-    async def start(self) -> bool:
+    async def start(self):
         if self.sync_client:
-            return False
+            return
         hosts = [{'host': self._elastic_host, 'port': self._elastic_port}]
         self.sync_client = AsyncElasticsearch(hosts, timeout=self.sync_timeout)
         self.search_client = AsyncElasticsearch(hosts, timeout=self.search_timeout)
@@ -80,6 +199,11 @@ class SearchIndex:
                 self.logger.warning("Failed to connect to Elasticsearch. Waiting for it!")
                 await asyncio.sleep(1)
 
+    async def create_index(self) -> bool:
+        # stored once so trending updates reference it by id instead of sending the source with every claim
+        await self.sync_client.put_script(
+            self.trending_script_id, {'script': {'lang': 'painless', 'source': TRENDING_SCORE_SCRIPT}}
+        )
         res = await self.sync_client.indices.create(self.index, INDEX_DEFAULT_SETTINGS, ignore=400)
         acked = res.get('acknowledged', False)
         if acked:
@@ -153,122 +277,6 @@ class SearchIndex:
         return update
 
     async def update_trending_score(self, params):
-        update_trending_score_script = """
-        double softenLBC(double lbc) { return (Math.pow(lbc, 1.0 / 3.0)); }
-
-        double logsumexp(double x, double y)
-        {
-            double top;
-            if(x > y)
-                top = x;
-            else
-                top = y;
-            double result = top + Math.log(Math.exp(x-top) + Math.exp(y-top));
-            return(result);
-        }
-
-        double logdiffexp(double big, double small)
-        {
-            return big + Math.log(1.0 - Math.exp(small - big));
-        }
-
-        double squash(double x)
-        {
-            if(x < 0.0)
-                return -Math.log(1.0 - x);
-            else
-                return Math.log(x + 1.0);
-        }
-
-        double unsquash(double x)
-        {
-            if(x < 0.0)
-                return 1.0 - Math.exp(-x);
-            else
-                return Math.exp(x) - 1.0;
-        }
-
-        double log_to_squash(double x)
-        {
-            return logsumexp(x, 0.0);
-        }
-
-        double squash_to_log(double x)
-        {
-            //assert x > 0.0;
-            return logdiffexp(x, 0.0);
-        }
-
-        double squashed_add(double x, double y)
-        {
-            // squash(unsquash(x) + unsquash(y)) but avoiding overflow.
-            // Cases where the signs are the same
-            if (x < 0.0 && y < 0.0)
-                return -logsumexp(-x, logdiffexp(-y, 0.0));
-            if (x >= 0.0 && y >= 0.0)
-                return logsumexp(x, logdiffexp(y, 0.0));
-            // Where the signs differ
-            if (x >= 0.0 && y < 0.0)
-                if (Math.abs(x) >= Math.abs(y))
-                    return logsumexp(0.0, logdiffexp(x, -y));
-                else
-                    return -logsumexp(0.0, logdiffexp(-y, x));
-            if (x < 0.0 && y >= 0.0)
-            {
-                // Addition is commutative, hooray for new math
-                return squashed_add(y, x);
-            }
-            return 0.0;
-        }
-
-        double squashed_multiply(double x, double y)
-        {
-            // squash(unsquash(x)*unsquash(y)) but avoiding overflow.
-            int sign;
-            if(x*y >= 0.0)
-                sign = 1;
-            else
-                sign = -1;
-            return sign*logsumexp(squash_to_log(Math.abs(x))
-                            + squash_to_log(Math.abs(y)), 0.0);
-        }
-
-        // Squashed inflated units
-        double inflateUnits(int height) {
-            double timescale = 576.0; // Half life of 400 = e-folding time of a day
-                                      // by coincidence, so may as well go with it
-            return log_to_squash(height / timescale);
-        }
-
-        double spikePower(double newAmount) {
-            if (newAmount < 50.0) {
-                return(0.5);
-            } else if (newAmount < 85.0) {
-                return(newAmount / 100.0);
-            } else {
-                return(0.85);
-            }
-        }
-
-        double spikeMass(double oldAmount, double newAmount) {
-            double softenedChange = softenLBC(Math.abs(newAmount - oldAmount));
-            double changeInSoftened = Math.abs(softenLBC(newAmount) - softenLBC(oldAmount));
-            double power = spikePower(newAmount);
-            if (oldAmount > newAmount) {
-                -1.0 * Math.pow(changeInSoftened, power) * Math.pow(softenedChange, 1.0 - power)
-            } else {
-                Math.pow(changeInSoftened, power) * Math.pow(softenedChange, 1.0 - power)
-            }
-        }
-        for (i in params.src.changes) {
-            double units = inflateUnits(i.height);
-            if (ctx._source.trending_score == null) {
-                ctx._source.trending_score = 0.0;
-            }
-            double bigSpike = squashed_multiply(units, squash(spikeMass(i.prev_amount, i.new_amount)));
-            ctx._source.trending_score = squashed_add(ctx._source.trending_score, bigSpike);
-        }
-        """
         start = time.perf_counter()
 
         def producer():
@@ -278,8 +286,7 @@ class SearchIndex:
                     '_index': self.index,
                     '_op_type': 'update',
                     'script': {
-                        'lang': 'painless',
-                        'source': update_trending_score_script,
+                        'id': self.trending_script_id,
                         'params': {'src': {
                             'changes': [
                                 {
@@ -442,10 +449,13 @@ class SearchIndex:
                     reordered_hits = cache_item.result
                 else:
                     query = expand_query(**kwargs)
-                    search_hits = deque((await self.search_client.search(
-                        query, index=self.index, track_total_hits=False,
-                        _source_includes=['_id', 'channel_id', 'reposted_claim_id', 'creation_height']
-                    ))['hits']['hits'])
+                    # read the few fields needed for reordering from doc values instead of loading the _source
+                    # of every one of the (up to 1000) hits
+                    query['_source'] = False
+                    query['docvalue_fields'] = list(SEARCH_AHEAD_DOCVALUE_FIELDS)
+                    search_hits = deque(map(expand_docvalue_hit, (await self.search_client.search(
+                        query, index=self.index, track_total_hits=False
+                    ))['hits']['hits']))
                     if remove_duplicates:
                         search_hits = self.__remove_duplicates(search_hits)
                     if per_channel_per_page > 0:
@@ -672,6 +682,21 @@ def expand_query(**kwargs):
     return query
 
 
+SEARCH_AHEAD_DOCVALUE_FIELDS = {
+    'channel_id.keyword': 'channel_id',
+    'reposted_claim_id.keyword': 'reposted_claim_id',
+    'creation_height': 'creation_height'
+}
+
+
+def expand_docvalue_hit(hit):
+    fields = hit.get('fields', {})
+    hit['_source'] = {
+        name: fields[field][0] if field in fields else None for field, name in SEARCH_AHEAD_DOCVALUE_FIELDS.items()
+    }
+    return hit
+
+
 def expand_result(results):
     inner_hits = []
     expanded = []
@@ -687,8 +712,8 @@ def expand_result(results):
         else:
             result['reposted_claim_hash'] = None
         result['channel_hash'] = unhexlify(result['channel_id'])[::-1] if result['channel_id'] else None
-        result['txo_hash'] = unhexlify(result['tx_id'])[::-1] + struct.pack('<I', result['tx_nout'])
-        result['tx_hash'] = unhexlify(result['tx_id'])[::-1]
+        result['tx_hash'] = tx_hash = unhexlify(result['tx_id'])[::-1]
+        result['txo_hash'] = tx_hash + struct.pack('<I', result['tx_nout'])
         result['reposted'] = result.pop('repost_count')
         result['signature_valid'] = result.pop('is_signature_valid')
         # result['normalized'] = result.pop('normalized_name')
@@ -93,14 +93,16 @@ async def make_es_index_and_run_sync(env: Env, clients=32, force=False, db=None,
     index = SearchIndex(env.es_index_prefix, elastic_host=env.elastic_host, elastic_port=env.elastic_port)
     logging.info("ES sync host: %s:%i", env.elastic_host, env.elastic_port)
     try:
-        created = await index.start()
+        await index.start()
+        created = await index.create_index()
     except IndexVersionMismatch as err:
         logging.info(
             "dropping ES search index (version %s) for upgrade to version %s", err.got_version, err.expected_version
         )
         await index.delete_index()
         await index.stop()
-        created = await index.start()
+        await index.start()
+        created = await index.create_index()
     finally:
         index.stop()
 
@@ -18,6 +18,7 @@ import zlib
 import base64
 from typing import Optional, Iterable, Tuple, DefaultDict, Set, Dict, List, TYPE_CHECKING
 from functools import partial
+from operator import attrgetter, itemgetter
 from asyncio import sleep
 from bisect import bisect_right
 from collections import defaultdict
@@ -197,7 +198,8 @@ class LevelDB:
 
     def _prepare_resolve_result(self, tx_num: int, position: int, claim_hash: bytes, name: str,
                                 root_tx_num: int, root_position: int, activation_height: int,
-                                signature_valid: bool) -> ResolveResult:
+                                signature_valid: bool,
+                                channel_short_urls: Optional[Dict[bytes, str]] = None) -> ResolveResult:
         try:
             normalized_name = normalize_name(name)
         except UnicodeDecodeError:
@@ -220,12 +222,17 @@ class LevelDB:
         canonical_url = short_url
         claims_in_channel = self.get_claims_in_channel_count(claim_hash)
         if channel_hash:
-            channel_vals = self.get_cached_claim_txo(channel_hash)
-            if channel_vals:
-                channel_short_url = self.get_short_claim_id_url(
-                    channel_vals.name, channel_vals.normalized_name, channel_hash, channel_vals.root_tx_num,
-                    channel_vals.root_position
-                )
+            channel_short_url = None if channel_short_urls is None else channel_short_urls.get(channel_hash)
+            if channel_short_url is None:
+                channel_vals = self.get_cached_claim_txo(channel_hash)
+                if channel_vals:
+                    channel_short_url = self.get_short_claim_id_url(
+                        channel_vals.name, channel_vals.normalized_name, channel_hash, channel_vals.root_tx_num,
+                        channel_vals.root_position
+                    )
+                    if channel_short_urls is not None:
+                        channel_short_urls[channel_hash] = channel_short_url
+            if channel_short_url is not None:
                 canonical_url = f'{channel_short_url}/{short_url}'
         return ResolveResult(
             name, normalized_name, claim_hash, tx_num, position, tx_hash, height, claim_amount, short_url=short_url,
@@ -262,11 +269,12 @@ class LevelDB:
 
         if claim_id:
             if len(claim_id) == 40:  # a full claim id
-                claim_txo = self.get_claim_txo(bytes.fromhex(claim_id))
+                claim_hash = bytes.fromhex(claim_id)
+                claim_txo = self.get_claim_txo(claim_hash)
                 if not claim_txo or normalized_name != claim_txo.normalized_name:
                     return
                 return self._prepare_resolve_result(
-                    claim_txo.tx_num, claim_txo.position, bytes.fromhex(claim_id), claim_txo.name,
+                    claim_txo.tx_num, claim_txo.position, claim_hash, claim_txo.name,
                     claim_txo.root_tx_num, claim_txo.root_position,
                     self.get_activation(claim_txo.tx_num, claim_txo.position), claim_txo.channel_signature_is_valid
                 )
@@ -306,7 +314,7 @@ class LevelDB:
                 break
         if not candidates:
             return
-        return list(sorted(candidates, key=lambda item: item[1]))[0]
+        return min(candidates, key=itemgetter(1))
 
     def _resolve(self, url) -> ExpandedResolveResult:
         try:
@@ -437,13 +445,13 @@ class LevelDB:
 
     async def reload_blocking_filtering_streams(self):
         def reload():
-            self.blocked_streams, self.blocked_channels = self.get_streams_and_channels_reposted_by_channel_hashes(
-                self.blocking_channel_hashes
-            )
-            self.filtered_streams, self.filtered_channels = self.get_streams_and_channels_reposted_by_channel_hashes(
-                self.filtering_channel_hashes
+            return (
+                self.get_streams_and_channels_reposted_by_channel_hashes(self.blocking_channel_hashes),
+                self.get_streams_and_channels_reposted_by_channel_hashes(self.filtering_channel_hashes)
             )
-        await asyncio.get_event_loop().run_in_executor(None, reload)
+        # the new dicts are built off the loop and swapped in together, readers never need a lock
+        (self.blocked_streams, self.blocked_channels), (self.filtered_streams, self.filtered_channels) = \
+            await asyncio.get_event_loop().run_in_executor(None, reload)
 
     def get_streams_and_channels_reposted_by_channel_hashes(self, reposter_channel_hashes: Set[bytes]):
         streams, channels = {}, {}
@@ -451,7 +459,7 @@ class LevelDB:
             for stream in self.prefix_db.channel_to_claim.iterate((reposter_channel_hash, ), include_key=False):
                 repost = self.get_repost(stream.claim_hash)
                 if repost:
-                    txo = self.get_claim_txo(repost)
+                    txo = self.get_cached_claim_txo(repost)
                     if txo:
                         if txo.normalized_name.startswith('@'):
                             channels[repost] = reposter_channel_hash
@@ -681,13 +689,13 @@ class LevelDB:
             if claim:
                 batch.append(claim)
             if len(batch) == batch_size:
-                batch.sort(key=lambda x: x.tx_hash)  # sort is to improve read-ahead hits
+                batch.sort(key=attrgetter('tx_hash'))  # sort is to improve read-ahead hits
                 for claim in batch:
                     meta = self._prepare_claim_metadata(claim.claim_hash, claim)
                     if meta:
                         yield meta
                 batch.clear()
-        batch.sort(key=lambda x: x.tx_hash)
+        batch.sort(key=attrgetter('tx_hash'))
         for claim in batch:
             meta = self._prepare_claim_metadata(claim.claim_hash, claim)
             if meta:
@@ -714,6 +722,8 @@ class LevelDB:
     def claims_producer(self, claim_hashes: Set[bytes]):
         batch = []
         results = []
+        # claims touched in a block are often in the same channel, only resolve its short url once
+        channel_short_urls = {}
 
         for claim_hash in claim_hashes:
             claim_txo = self.get_cached_claim_txo(claim_hash)
@@ -727,12 +737,12 @@ class LevelDB:
             activation = self.get_activation(claim_txo.tx_num, claim_txo.position)
             claim = self._prepare_resolve_result(
                 claim_txo.tx_num, claim_txo.position, claim_hash, claim_txo.name, claim_txo.root_tx_num,
-                claim_txo.root_position, activation, claim_txo.channel_signature_is_valid
+                claim_txo.root_position, activation, claim_txo.channel_signature_is_valid, channel_short_urls
             )
             if claim:
                 batch.append(claim)
 
-        batch.sort(key=lambda x: x.tx_hash)
+        batch.sort(key=attrgetter('tx_hash'))
 
         for claim in batch:
             _meta = self._prepare_claim_metadata(claim.claim_hash, claim)
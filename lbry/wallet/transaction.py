@@ -1,7 +1,8 @@
 import struct
 import logging
 import typing
-from binascii import hexlify, unhexlify
+from binascii import unhexlify
+from functools import lru_cache
 from typing import List, Iterable, Optional, Tuple
 
 from coincurve import PublicKey as cPublicKey
@@ -35,6 +36,12 @@ if typing.TYPE_CHECKING:
 log = logging.getLogger()
 
 
+@lru_cache(maxsize=2 ** 12)
+def _load_public_key(public_key_bytes: bytes) -> cPublicKey:
+    # a channel usually signs many claims, skip decompressing its key each time
+    return cPublicKey(public_key_bytes)
+
+
 class TXRefMutable(TXRef):
 
     __slots__ = ('tx',)
@@ -46,7 +53,7 @@ class TXRefMutable(TXRef):
     @property
     def id(self):
         if self._id is None:
-            self._id = hexlify(self.hash[::-1]).decode()
+            self._id = self.hash[::-1].hex()
         return self._id
 
     @property
@@ -348,7 +355,7 @@ class Output(InputOutput):
 
     @property
     def claim_id(self) -> str:
-        return hexlify(self.claim_hash[::-1]).decode()
+        return self.claim_hash[::-1].hex()
 
     @property
     def claim_name(self) -> str:
@@ -427,7 +434,7 @@ class Output(InputOutput):
     @staticmethod
     def is_signature_valid(signature, digest, public_key_bytes):
         signature = cdata_to_der(deserialize_compact(signature))
-        public_key = cPublicKey(public_key_bytes)
+        public_key = _load_public_key(public_key_bytes)
         is_valid = public_key.verify(signature, digest, None)
         if not is_valid: # try old way
             # ytsync signed claims don't seem to validate with coincurve
@@ -461,7 +468,7 @@ class Output(InputOutput):
         pieces = [timestamp.encode(), self.claim_hash, data]
         digest = sha256(b''.join(pieces))
         signature = self.private_key.sign_compact(digest)
-        return hexlify(signature).decode()
+        return signature.hex()
 
     def clear_signature(self):
         self.channel = None
@@ -580,6 +587,10 @@ class Transaction:
         if raw is not None:
             self._deserialize()
 
+    @classmethod
+    def from_hex(cls, raw_hex: str, **kwargs) -> 'Transaction':
+        return cls(bytes.fromhex(raw_hex), **kwargs)
+
     @property
     def is_broadcast(self):
         return self.height > -2
@@ -620,9 +631,13 @@ class Transaction:
         return self.raw
 
     def _reset(self):
+        self._raw_outputs = None
+        self._reset_raw_only()
+
+    def _reset_raw_only(self):
+        # for changes that leave the outputs alone, keeps their cached serialization
         self._raw = None
         self._raw_sans_segwit = None
-        self._raw_outputs = None
         self.ref.reset()
 
     @property
@@ -643,7 +658,9 @@ class Transaction:
         return self
 
     def add_inputs(self, inputs: Iterable[Input]) -> 'Transaction':
-        return self._add(self._inputs, inputs, True)
+        self._add(self._inputs, inputs)
+        self._reset_raw_only()
+        return self
 
     def add_outputs(self, outputs: Iterable[Output]) -> 'Transaction':
         return self._add(self._outputs, outputs, True)
@@ -815,6 +832,8 @@ class Transaction:
         )
         # value of the inputs less the cost to spend those inputs
         payment = tx.get_effective_input_sum(ledger)
+        # fee for adding a change output, the same on every pass below
+        change_output_fee = Output.pay_pubkey_hash(COIN, NULL_HASH32).get_fee(ledger)
 
         try:
 
@@ -828,10 +847,7 @@ class Transaction:
                     payment += sum(s.effective_amount for s in spendables)
                     tx.add_inputs(s.txi for s in spendables)
 
-                cost_of_change = (
-                    tx.get_base_fee(ledger) +
-                    Output.pay_pubkey_hash(COIN, NULL_HASH32).get_fee(ledger)
-                )
+                cost_of_change = tx.get_base_fee(ledger) + change_output_fee
                 if payment > cost:
                     change = payment - cost
                     if change > cost_of_change:
@@ -840,7 +856,7 @@ class Transaction:
                         change_amount = change - cost_of_change
                         change_output = Output.pay_pubkey_hash(change_amount, change_hash160)
                         change_output.is_internal_transfer = True
-                        tx.add_outputs([Output.pay_pubkey_hash(change_amount, change_hash160)])
+                        tx.add_outputs([change_output])
 
                 if tx._outputs:
                     break
@@ -888,7 +904,7 @@ class Transaction:
                 txi.script.generate()
             else:
                 raise NotImplementedError("Don't know how to spend this output.")
-        self._reset()
+        self._reset_raw_only()
 
     @classmethod
     def pay(cls, amount: int, address: bytes, funding_accounts: List['Account'], change_account: 'Account'):
@@ -960,19 +976,17 @@ class Transaction:
                 yield txi
 
     def _filter_my_outputs(self, f):
-        for txo in self.outputs:
+        for txo in self._outputs:
             if txo.is_my_output and f(txo.script):
                 yield txo
 
     def _filter_other_outputs(self, f):
-        for txo in self.outputs:
+        for txo in self._outputs:
             if not txo.is_my_output and f(txo.script):
                 yield txo
 
     def _filter_any_outputs(self, f):
-        for txo in self.outputs:
-            if f(txo):
-                yield txo
+        return filter(f, self._outputs)
 
     @property
     def my_claim_outputs(self):
@@ -996,14 +1010,13 @@ class Transaction:
 
     @property
     def my_abandon_outputs(self):
+        updated_claim_hashes = None
         for txi in self.inputs:
             abandon = txi.txo_ref.txo
             if abandon is not None and abandon.is_my_output and abandon.script.is_claim_involved:
-                is_update = False
                 if abandon.script.is_claim_name or abandon.script.is_update_claim:
-                    for update in self.my_update_outputs:
-                        if abandon.claim_id == update.claim_id:
-                            is_update = True
-                            break
-                if not is_update:
-                    yield abandon
+                    if updated_claim_hashes is None:
+                        updated_claim_hashes = {update.claim_hash for update in self.my_update_outputs}
+                    if abandon.claim_hash in updated_claim_hashes:
+                        continue
+                yield abandon
@@ -188,7 +188,6 @@ class TestHubDiscovery(CommandTestCase):
 
         kp_final_node.server.session_mgr._notify_peer('127.0.0.1:9988')
         await self.daemon.ledger.network.on_hub.first
-        await asyncio.sleep(0.5)  # wait for above event to be processed by other listeners
         self.assertEqual(
             self.daemon.conf.known_hubs.filter(), {
                 (relay_node.hostname, relay_node.port): {"country": "FR"},
@@ -52,6 +52,17 @@ class BaseResolveTestCase(CommandTestCase):
             self.assertEqual(claim_id, other['claim_id'])
             self.assertEqual(claim_id, claim_from_es[0][0]['claim_hash'][::-1].hex())
 
+    async def assertResolvesToClaimIds(self, expected: dict):
+        """ Resolve all of the urls in a single call and check the claim ids they resolve to. """
+        resolved = await self.out(self.daemon.jsonrpc_resolve(list(expected)))
+        claim_ids = list(set(expected.values()))
+        claims_from_es = await self.conductor.spv_node.server.bp.db.search_index.search(
+            claim_id__in=claim_ids, limit=len(claim_ids)
+        )
+        self.assertSetEqual(set(claim_ids), {c['claim_hash'][::-1].hex() for c in claims_from_es[0]})
+        for url, claim_id in expected.items():
+            self.assertEqual(claim_id, resolved[url].get('claim_id'), url)
+
     async def assertNoClaimForName(self, name: str):
         lbrycrd_winning = json.loads(await self.blockchain._cli_cmnd('getvalueforname', name))
         stream, channel, _, _ = await self.conductor.spv_node.server.bp.db.resolve(name)
@@ -129,12 +140,20 @@ class BaseResolveTestCase(CommandTestCase):
         self.assertEqual(total_amount, es_support_amount, f"lbrycrd support amount: {total_amount} vs es: {es_support_amount}")
 
     async def assertMatchClaimsForName(self, name):
-        expected = json.loads(await self.blockchain._cli_cmnd('getclaimsforname', name))
+        expected, winning = await self.blockchain.batch_rpc([
+            ('getclaimsforname', [name]), ('getvalueforname', [name])
+        ])
 
         db = self.conductor.spv_node.server.bp.db
         # self.assertEqual(len(expected['claims']), len(db_claims.claims))
         # self.assertEqual(expected['lastTakeoverHeight'], db_claims.lastTakeoverHeight)
-        last_takeover = json.loads(await self.blockchain._cli_cmnd('getvalueforname', name))['lastTakeoverHeight']
+        last_takeover = winning['lastTakeoverHeight']
+
+        claims_from_es = defaultdict(list)
+        if expected['claims']:
+            claim_ids = [c['claimId'] for c in expected['claims']]
+            for claim_from_es in (await db.search_index.search(claim_id__in=claim_ids, limit=len(claim_ids)))[0]:
+                claims_from_es[claim_from_es['claim_hash'][::-1].hex()].append(claim_from_es)
 
         for c in expected['claims']:
             c['lastTakeoverHeight'] = last_takeover
@@ -143,13 +162,10 @@ class BaseResolveTestCase(CommandTestCase):
             claim = db._fs_get_claim_by_hash(claim_hash)
             self.assertMatchDBClaim(c, claim)
 
-            claim_from_es = await self.conductor.spv_node.server.bp.db.search_index.search(
-                claim_id=c['claimId']
-            )
-            self.assertEqual(len(claim_from_es[0]), 1)
-            self.assertEqual(claim_from_es[0][0]['claim_hash'][::-1].hex(), c['claimId'])
-            self.assertMatchESClaim(claim_from_es[0][0], claim)
-            self._check_supports(c['claimId'], c['supports'], claim_from_es[0][0]['support_amount'])
+            self.assertEqual(len(claims_from_es[claim_id]), 1)
+            claim_from_es = claims_from_es[claim_id][0]
+            self.assertMatchESClaim(claim_from_es, claim)
+            self._check_supports(c['claimId'], c['supports'], claim_from_es['support_amount'])
 
 
 class ResolveCommand(BaseResolveTestCase):
@@ -159,16 +175,24 @@ class ResolveCommand(BaseResolveTestCase):
         colliding_claim_ids = []
         first_claims_one_char_shortid = {}
 
+        unconfirmed = 0
         while True:
-            chan = self.get_claim_id(
-                await self.channel_create('@abc', '0.01', allow_duplicate_name=True)
-            )
+            tx = await self.channel_create('@abc', '0.01', allow_duplicate_name=True, confirm=False, return_tx=True)
+            await self.ledger.wait(tx)
+            # share blocks between the channels, staying well under the mempool's chained tx limit
+            unconfirmed += 1
+            if unconfirmed == 10:
+                await self.generate(1)
+                unconfirmed = 0
+            chan = tx.outputs[0].claim_id
             if chan[:1] not in first_claims_one_char_shortid:
                 first_claims_one_char_shortid[chan[:1]] = chan
             prefixes[chan[:2]].append(chan)
             if len(prefixes[chan[:2]]) > 1:
                 colliding_claim_ids.extend(prefixes[chan[:2]])
                 break
+        if unconfirmed:
+            await self.generate(1)
         first_claim = first_claims_one_char_shortid[colliding_claim_ids[0][:1]]
         await self.assertResolvesToClaimId(
             f'@abc#{colliding_claim_ids[0][:1]}', first_claim
@@ -179,14 +203,16 @@ class ResolveCommand(BaseResolveTestCase):
                 collision_depth += 1
             else:
                 break
-        await self.assertResolvesToClaimId(f'@abc#{colliding_claim_ids[0][:2]}', colliding_claim_ids[0])
-        await self.assertResolvesToClaimId(f'@abc#{colliding_claim_ids[0][:7]}', colliding_claim_ids[0])
-        await self.assertResolvesToClaimId(f'@abc#{colliding_claim_ids[0][:17]}', colliding_claim_ids[0])
-        await self.assertResolvesToClaimId(f'@abc#{colliding_claim_ids[0]}', colliding_claim_ids[0])
-        await self.assertResolvesToClaimId(f'@abc#{colliding_claim_ids[1][:collision_depth + 1]}', colliding_claim_ids[1])
-        await self.assertResolvesToClaimId(f'@abc#{colliding_claim_ids[1][:7]}', colliding_claim_ids[1])
-        await self.assertResolvesToClaimId(f'@abc#{colliding_claim_ids[1][:17]}', colliding_claim_ids[1])
-        await self.assertResolvesToClaimId(f'@abc#{colliding_claim_ids[1]}', colliding_claim_ids[1])
+        await self.assertResolvesToClaimIds({
+            f'@abc#{colliding_claim_ids[0][:2]}': colliding_claim_ids[0],
+            f'@abc#{colliding_claim_ids[0][:7]}': colliding_claim_ids[0],
+            f'@abc#{colliding_claim_ids[0][:17]}': colliding_claim_ids[0],
+            f'@abc#{colliding_claim_ids[0]}': colliding_claim_ids[0],
+            f'@abc#{colliding_claim_ids[1][:collision_depth + 1]}': colliding_claim_ids[1],
+            f'@abc#{colliding_claim_ids[1][:7]}': colliding_claim_ids[1],
+            f'@abc#{colliding_claim_ids[1][:17]}': colliding_claim_ids[1],
+            f'@abc#{colliding_claim_ids[1]}': colliding_claim_ids[1],
+        })
 
     async def test_abandon_channel_and_claims_in_same_tx(self):
         channel_id = self.get_claim_id(
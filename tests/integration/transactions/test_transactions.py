@@ -148,11 +148,8 @@ class BasicTransactionTests(IntegrationTestCase):
             return summary
         self.conductor.spv_node.server.bp.mempool.transaction_summaries = random_summary
         # 10 unconfirmed txs, all from blockchain wallet
-        sends = [self.blockchain.send_to_address(address, 10) for _ in range(10)]
-        # use batching to reduce issues with send_to_address on cli
-        for batch in range(0, len(sends), 10):
-            txids = await asyncio.gather(*sends[batch:batch + 10])
-            await asyncio.wait([self.on_transaction_id(txid) for txid in txids])
+        txids = await self.blockchain.batch_rpc([('sendtoaddress', [address, 10])] * 10)
+        await asyncio.wait([self.on_transaction_id(txid) for txid in txids])
         remote_status = await self.ledger.network.subscribe_address(address)
         self.assertTrue(await self.ledger.update_history(address, remote_status))
         # 20 unconfirmed txs, 10 from blockchain, 10 from local to local
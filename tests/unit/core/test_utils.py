@@ -21,6 +21,16 @@ class CompareVersionTest(unittest.TestCase):
         self.assertTrue(utils.version_is_greater_than('1.3.9', '1.3.9rc0'))
 
 
+class StrToBoolTest(unittest.TestCase):
+    def test_str_to_bool(self):
+        for value in ('y', 'yes', 't', 'True', 'ON', '1'):
+            self.assertIs(utils.str_to_bool(value), True)
+        for value in ('n', 'No', 'f', 'false', 'off', '0'):
+            self.assertIs(utils.str_to_bool(value), False)
+        with self.assertRaisesRegex(ValueError, "invalid truth value 'maybe'"):
+            utils.str_to_bool('maybe')
+
+
 class ObfuscationTest(unittest.TestCase):
     def test_deobfuscation_reverses_obfuscation(self):
         plain = "my_test_string"
@@ -134,3 +144,26 @@ class CacheConcurrentDecoratorTests(AsyncioTestCase):
         t3.add_done_callback(lambda _: t2.cancel())
         with self.assertRaises(asyncio.CancelledError):
             await asyncio.gather(t1, t2, t3)
+
+
+class FastAsyncLockTests(AsyncioTestCase):
+
+    async def test_uncontended_acquire(self):
+        lock = utils.FastAsyncLock()
+        async with lock:
+            self.assertTrue(lock.locked())
+        self.assertFalse(lock.locked())
+
+    async def test_contended_acquire_waits(self):
+        lock = utils.FastAsyncLock()
+        order = []
+
+        async def hold(name):
+            async with lock:
+                order.append(name)
+                await asyncio.sleep(0)
+                order.append(name)
+
+        await asyncio.gather(hold(1), hold(2))
+        self.assertListEqual([1, 1, 2, 2], order)
+        self.assertFalse(lock.locked())
@@ -0,0 +1,66 @@
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from lbry.testcase import AsyncioTestCase
+from lbry.wallet import Ledger
+from lbry.wallet.server.block_processor import BlockProcessor
+from tests.unit.wallet.test_schema_signing import get_channel, get_stream
+
+
+def make_block_processor(channel_txo, parallel_signature_threshold):
+    bp = BlockProcessor.__new__(BlockProcessor)
+    bp.logger = logging.getLogger(__name__)
+    bp.ledger = Ledger
+    bp.parallel_signature_threshold = parallel_signature_threshold
+    bp._signature_workers = 2
+    bp._signature_executor = ThreadPoolExecutor(2)
+    bp.prevalidated_signatures = {}
+    bp.pending_channels = {}
+    bp.pending_channel_counts = defaultdict(int)
+    bp.doesnt_have_valid_signature = set()
+    bp.claim_channels = {}
+    bp.db = mock.Mock()
+    bp.db.get_claim_txo.return_value = mock.Mock(tx_num=1, position=0)
+    bp.db.get_tx_hash.return_value = b'\x00' * 32
+    bp.db.prefix_db.tx.get.return_value = b'raw channel tx'
+    bp._get_channel_public_key = lambda raw_channel_tx, position: channel_txo.claim.channel.public_key_bytes
+    return bp
+
+
+class TestSignaturePrevalidation(AsyncioTestCase):
+
+    async def test_prevalidated_signatures_match_serial_path(self):
+        channel = await get_channel()
+        streams = []
+        for i in range(4):
+            stream = get_stream(f'stream{i}')
+            stream.sign(channel)
+            streams.append(stream)
+        streams[-1].claim.stream.title = 'altered after signing'
+        txs = [(None, stream.tx_ref.hash) for stream in streams]
+        block_txos = [[stream] for stream in streams]
+        signing_channel_hash = channel.claim_hash[::-1]
+
+        results = []
+        for threshold in (2, 1000):
+            bp = make_block_processor(channel, threshold)
+            self.addCleanup(bp._signature_executor.shutdown)
+            bp._prevalidate_signatures(txs, block_txos)
+            self.assertEqual(len(streams) if threshold == 2 else 0, len(bp.prevalidated_signatures))
+            for stream in streams:
+                claim_hash = stream.claim_hash[::-1]
+                bp.doesnt_have_valid_signature.add(claim_hash)
+                bp._validate_channel_signature(stream, stream.tx_ref.hash, 0, claim_hash, signing_channel_hash)
+            self.assertDictEqual({}, bp.prevalidated_signatures)
+            results.append((bp.claim_channels, dict(bp.pending_channel_counts), bp.doesnt_have_valid_signature))
+
+        parallel, serial = results
+        self.assertEqual(serial, parallel)
+        claim_channels, pending_channel_counts, doesnt_have_valid_signature = parallel
+        self.assertDictEqual(
+            {stream.claim_hash[::-1]: signing_channel_hash for stream in streams[:-1]}, claim_channels
+        )
+        self.assertDictEqual({signing_channel_hash: 3}, pending_channel_counts)
+        self.assertSetEqual({streams[-1].claim_hash[::-1]}, doesnt_have_valid_signature)
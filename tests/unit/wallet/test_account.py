@@ -6,6 +6,7 @@ from lbry.wallet import (
     Account, SingleKey, HierarchicalDeterministic,
     DeterministicChannelKeyManager
 )
+from lbry.wallet.bip32 import KeyPath
 
 
 class TestAccount(AsyncioTestCase):
@@ -100,6 +101,18 @@ class TestAccount(AsyncioTestCase):
         new_keys = await account.receiving.ensure_address_gap()
         self.assertEqual(len(new_keys), 20)
 
+    async def test_iter_address_records(self):
+        account = Account.generate(self.ledger, Wallet(), 'lbryum')
+        await account.ensure_address_gap()
+        records = [r async for r in account.receiving.iter_address_records(chunk_size=7)]
+        self.assertListEqual([r['n'] for r in records], list(range(20)))
+        self.assertListEqual(
+            [r['address'] for r in records],
+            [r['address'] for r in await account.receiving.get_address_records(order_by='n asc')]
+        )
+        addresses = [address async for address in account.iter_addresses(chunk_size=7)]
+        self.assertCountEqual(addresses, await account.get_addresses())
+
     async def test_get_or_create_usable_address(self):
         account = Account.generate(self.ledger, Wallet(), 'lbryum')
 
@@ -180,6 +193,30 @@ class TestAccount(AsyncioTestCase):
         account_data['ledger'] = 'lbc_mainnet'
         self.assertDictEqual(account_data, account.to_dict())
 
+    def test_chain_private_key_follows_encryption(self):
+        account = Account.generate(self.ledger, Wallet(), 'lbryum')
+        expected = account.private_key.child(KeyPath.RECEIVE).child(3).extended_key_string()
+        self.assertEqual(account.get_private_key(KeyPath.RECEIVE, 3).extended_key_string(), expected)
+        account.encrypt('password')
+        self.assertIsNone(account.receiving._private_chain)
+        self.assertIsNone(account.change._private_chain)
+        account.decrypt('password')
+        self.assertEqual(account.get_private_key(KeyPath.RECEIVE, 3).extended_key_string(), expected)
+
+    async def test_generate_next_channel_key(self):
+        account = Account.generate(self.ledger, Wallet(), 'lbryum')
+        channel_keys = account.deterministic_channel_keys
+        private_key = await channel_keys.generate_next_key()
+        self.assertEqual(
+            private_key.extended_key_string(),
+            account.private_key.child(KeyPath.CHANNEL).child(0).extended_key_string()
+        )
+        self.assertEqual(channel_keys.last_known, 0)
+        self.assertEqual(len(channel_keys.cache), DeterministicChannelKeyManager.BATCH_SIZE)
+        self.assertIs(channel_keys.get_private_key_from_pubkey_hash(private_key.address), private_key)
+        # unused key is handed out again without being re-derived
+        self.assertIs(await channel_keys.generate_next_key(), private_key)
+
     async def test_save_max_gap(self):
         account = Account.generate(
             self.ledger, Wallet(), 'lbryum', {
@@ -245,6 +282,57 @@ class TestAccount(AsyncioTestCase):
         self.assertEqual(account.receiving.gap, 8)
         self.assertEqual(account.receiving.maximum_uses_per_address, 9)
 
+    def test_hash_is_stable(self):
+        # the account hash feeds the wallet sync hash, the serialization it's computed from must not change
+        account = Account.from_dict(self.ledger, Wallet(), {
+            'name': 'Main Account',
+            'modified_on': 123,
+            'seed':
+                "carbon smart garage balance margin twelve chest sword toast envelope bottom stomac"
+                "h absent",
+            'encrypted': False,
+            'certificates': {
+                'bTZito1AqAhzmanUCMbAFMHk9ZzoNhbRpw': 'pem1',
+                'bEaCRr3CtMpKuN9eoTtA8WGhqqbEx7bwgH': 'pem2'
+            },
+            'address_generator': {
+                'name': 'deterministic-chain',
+                'receiving': {'gap': 17, 'maximum_uses_per_address': 2},
+                'change': {'gap': 10, 'maximum_uses_per_address': 2}
+            }
+        })
+        self.assertEqual(
+            hexlify(account.hash), b'fafe42a0bf1e58a62b2d92b6841ad49fa073407b9601ddd488df9e13412681cc'
+        )
+
+    def test_hash_invalidated_on_change(self):
+        account = Account.generate(self.ledger, Wallet(), 'lbryum')
+        original = account.hash
+        self.assertIs(account.hash, original)
+
+        account.name = 'Changed Name'
+        renamed = account.hash
+        self.assertNotEqual(renamed, original)
+
+        account.receiving.gap = 30
+        self.assertNotEqual(account.hash, renamed)
+        regapped = account.hash
+
+        account.channel_keys['address'] = 'pem'
+        self.assertNotEqual(account.hash, regapped)
+
+    def test_merge_without_changes_keeps_hash(self):
+        account = Account.generate(self.ledger, Wallet(), 'lbryum')
+        account.channel_keys['address'] = 'pem'
+        original = account.hash
+
+        account.merge(account.to_dict())
+        self.assertIs(account.hash, original)
+
+        account.merge({'modified_on': 0, 'certificates': {'address2': 'pem2'}})
+        self.assertEqual(account.channel_keys, {'address': 'pem', 'address2': 'pem2'})
+        self.assertNotEqual(account.hash, original)
+
 
 class TestSingleKeyAccount(AsyncioTestCase):
 
@@ -39,6 +39,15 @@ class BIP32Tests(AsyncioTestCase):
             new_key = pubkey.child(i)
             self.assertIsInstance(new_key, PublicKey)
             self.assertEqual(hexlify(new_key.identifier()), expected_ids[i])
+        with self.assertRaisesRegex(ValueError, 'invalid BIP32 public key child number'):
+            pubkey.children(-1, 5)
+        self.assertEqual(pubkey.children(5, 4), [])
+        children = pubkey.children(0, 19)
+        self.assertEqual([child.n for child in children], list(range(20)))
+        for child, expected_id in zip(children, expected_ids):
+            self.assertEqual(hexlify(child.identifier()), expected_id)
+            self.assertEqual(child.chain_code, pubkey.child(child.n).chain_code)
+            self.assertIs(child.parent, pubkey)
 
     async def test_private_key_validation(self):
         with self.assertRaisesRegex(TypeError, 'private key must be raw bytes'):
@@ -92,6 +92,17 @@ class TestUtils(TestCase):
         self.assertTrue(Ledger.is_script_address("rCz6yb1p33oYHToGZDzTjX7nFKaU3kNgBd"))
 
 
+class TestTransactionCache(LedgerTestCase):
+
+    async def test_only_verified_transactions_are_cached(self):
+        tx = get_transaction()
+        self.ledger.cache_transaction(tx)
+        self.assertIsNone(self.ledger.get_cached_transaction(tx.id))
+        tx.is_verified = True
+        self.ledger.cache_transaction(tx)
+        self.assertIs(tx, self.ledger.get_cached_transaction(tx.id))
+
+
 class TestSynchronization(LedgerTestCase):
 
     async def test_update_history(self):
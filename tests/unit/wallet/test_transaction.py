@@ -126,6 +126,19 @@ class TestAccountBalanceImpactFromTransaction(unittest.TestCase):
         tx.outputs[1].is_my_output = True
         self.assertEqual(tx.net_account_balance, -10*CENT)  # lost to fee
 
+    def test_my_abandon_outputs_skips_updated_claims(self):
+        claims = Transaction() \
+            .add_inputs([get_input()]) \
+            .add_outputs([Output.pay_claim_name_pubkey_hash(CENT, 'foo', b'', NULL_HASH32),
+                          Output.pay_claim_name_pubkey_hash(CENT, 'bar', b'', NULL_HASH32)])
+        updated, abandoned = claims.outputs
+        tx = Transaction() \
+            .add_inputs([Input.spend(updated), Input.spend(abandoned)]) \
+            .add_outputs([Output.pay_update_claim_pubkey_hash(CENT, 'foo', updated.claim_id, b'', NULL_HASH32)])
+        updated.is_my_output = abandoned.is_my_output = True
+        tx.outputs[0].is_my_output = True
+        self.assertEqual(list(tx.my_abandon_outputs), [abandoned])
+
 
 class TestTransactionSerialization(unittest.TestCase):
 
@@ -162,6 +175,10 @@ class TestTransactionSerialization(unittest.TestCase):
         tx._reset()
         self.assertEqual(tx.raw, raw)
 
+        tx = Transaction.from_hex(raw.hex(), height=1)
+        self.assertEqual(tx.raw, raw)
+        self.assertEqual(tx.height, 1)
+
     def test_coinbase_transaction(self):
         raw = unhexlify(
             "01000000010000000000000000000000000000000000000000000000000000000000000000ffffffff200"